@@ -5,18 +5,101 @@ focusing on core functionality without complex logger mocking.
 """
 
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 from scrapy.http import HtmlResponse, Request
 from zerdisha_scrapers.spiders.annapurna import AnnapurnaSpider
 
 
+# Fixture bodies encoded once at import time so each test skips the
+# per-call str-to-bytes encoding inside HtmlResponse.
+_HTML_WITH_CONTENT = b"""
+<html>
+    <body>
+        <h1>Test Article Title</h1>
+        <div class="single-content">
+            <p>This is the first paragraph of the article.</p>
+            <p>This is the second paragraph with more content.</p>
+            <p>And this is the final paragraph.</p>
+        </div>
+    </body>
+</html>
+"""
+
+_HTML_WITHOUT_CONTENT = b"""
+<html>
+    <body>
+        <h1>Test Article Title</h1>
+        <div class="different-class">
+            <p>This content won't be found by our selector.</p>
+        </div>
+    </body>
+</html>
+"""
+
+_HTML_WITH_META_DATE = b"""
+<html>
+    <head>
+        <meta property="article:published_time" content="2023-01-01T12:00:00Z" />
+    </head>
+    <body>
+        <div class="single-content">
+            <p>Test content</p>
+        </div>
+    </body>
+</html>
+"""
+
+# Responses parsed once at import time; each test clones one with a fresh
+# request via .replace() instead of rebuilding HtmlResponse (and its lxml
+# tree) per test method.
+_RESP_WITH_CONTENT = HtmlResponse(
+    url="https://theannapurnaexpress.com/test-article",
+    body=_HTML_WITH_CONTENT,
+    encoding='utf-8',
+)
+_RESP_WITH_CONTENT.selector  # force the parse eagerly
+
+_RESP_WITHOUT_CONTENT = HtmlResponse(
+    url="https://theannapurnaexpress.com/test-article",
+    body=_HTML_WITHOUT_CONTENT,
+    encoding='utf-8',
+)
+_RESP_WITHOUT_CONTENT.selector
+
+_RESP_WITH_META_DATE = HtmlResponse(
+    url="https://theannapurnaexpress.com/test-article",
+    body=_HTML_WITH_META_DATE,
+    encoding='utf-8',
+)
+_RESP_WITH_META_DATE.selector
+
+
 class TestAnnapurnaSpider(unittest.TestCase):
     """Test cases for the AnnapurnaSpider class."""
     
+    SPIDER_CLS = AnnapurnaSpider
+
+    @classmethod
+    def setUpClass(cls):
+        """Construct one spider and start the class-wide feed patcher.
+
+        Starting the patcher once here instead of decorating each test
+        avoids paying patcher setup/teardown per method.
+        """
+        cls.spider = cls.SPIDER_CLS()
+        cls._iter_entries_patcher = patch(
+            'zerdisha_scrapers.spiders.annapurna.rss.iter_entries')
+        cls.mock_iter_entries = cls._iter_entries_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the class-wide feed patcher."""
+        cls._iter_entries_patcher.stop()
+
     def setUp(self):
-        """Set up test fixtures."""
-        self.spider = AnnapurnaSpider()
+        """Reset the shared feed mock between tests."""
+        self.mock_iter_entries.reset_mock(return_value=True, side_effect=True)
     
     def test_spider_attributes(self):
         """Test that spider has correct basic attributes."""
@@ -24,23 +107,19 @@ class TestAnnapurnaSpider(unittest.TestCase):
         self.assertEqual(self.spider.allowed_domains, ["theannapurnaexpress.com"])
         self.assertEqual(self.spider.rss_url, "https://theannapurnaexpress.com/rss/")
     
-    @patch('zerdisha_scrapers.spiders.annapurna.feedparser.parse')
-    def test_start_requests_creates_requests_from_rss_feed(self, mock_feedparser):
+    def test_start_requests_creates_requests_from_rss_feed(self):
         """Test start_requests method creates requests from RSS feed."""
-        # Mock RSS feed response
-        mock_feed = Mock()
-        mock_feed.bozo = False
-        mock_feed.entries = [
-            Mock(
-                link="https://theannapurnaexpress.com/article1",
-                title="Test Article 1"
-            ),
-            Mock(
-                link="https://theannapurnaexpress.com/article2", 
-                title="Test Article 2"
-            )
+        # Mock RSS entries as yielded by rss.iter_entries
+        self.mock_iter_entries.return_value = [
+            {
+                "link": "https://theannapurnaexpress.com/article1",
+                "title": "Test Article 1"
+            },
+            {
+                "link": "https://theannapurnaexpress.com/article2",
+                "title": "Test Article 2"
+            }
         ]
-        mock_feedparser.return_value = mock_feed
         
         # Execute start_requests
         requests = list(self.spider.start_requests())
@@ -60,14 +139,10 @@ class TestAnnapurnaSpider(unittest.TestCase):
         self.assertEqual(second_request.url, "https://theannapurnaexpress.com/article2")
         self.assertEqual(second_request.meta['rss_title'], "Test Article 2")
     
-    @patch('zerdisha_scrapers.spiders.annapurna.feedparser.parse')
-    def test_start_requests_handles_empty_rss_feed(self, mock_feedparser):
+    def test_start_requests_handles_empty_rss_feed(self):
         """Test start_requests method handles empty RSS feed."""
-        # Mock empty RSS feed response
-        mock_feed = Mock()
-        mock_feed.bozo = False
-        mock_feed.entries = []
-        mock_feedparser.return_value = mock_feed
+        # Mock an RSS feed that yields no entries
+        self.mock_iter_entries.return_value = []
         
         # Execute start_requests
         requests = list(self.spider.start_requests())
@@ -75,22 +150,16 @@ class TestAnnapurnaSpider(unittest.TestCase):
         # Verify results
         self.assertEqual(len(requests), 0)
     
-    @patch('zerdisha_scrapers.spiders.annapurna.feedparser.parse')
-    def test_start_requests_skips_entries_without_links(self, mock_feedparser):
+    def test_start_requests_skips_entries_without_links(self):
         """Test start_requests method skips RSS entries without links."""
-        # Mock RSS feed with entry missing link
-        mock_feed = Mock()
-        mock_feed.bozo = False
-        mock_feed.entries = [
-            Mock(title="Test Article 1"),  # Missing link attribute
-            Mock(
-                link="https://theannapurnaexpress.com/article2",
-                title="Test Article 2"
-            )
+        # Mock RSS feed with an entry missing its link
+        self.mock_iter_entries.return_value = [
+            {"title": "Test Article 1"},  # Missing link key
+            {
+                "link": "https://theannapurnaexpress.com/article2",
+                "title": "Test Article 2"
+            }
         ]
-        # Remove link attribute from first entry
-        del mock_feed.entries[0].link
-        mock_feedparser.return_value = mock_feed
         
         # Execute start_requests
         requests = list(self.spider.start_requests())
@@ -101,36 +170,14 @@ class TestAnnapurnaSpider(unittest.TestCase):
 
     def test_parse_article_extracts_content_successfully(self):
         """Test parse_article method extracts content using correct selector."""
-        # Create mock HTML response
-        html_content = """
-        <html>
-            <body>
-                <h1>Test Article Title</h1>
-                <div class="single-content">
-                    <p>This is the first paragraph of the article.</p>
-                    <p>This is the second paragraph with more content.</p>
-                    <p>And this is the final paragraph.</p>
-                </div>
-            </body>
-        </html>
-        """
-        
-        # Create mock response with meta data
-        response = HtmlResponse(
-            url="https://theannapurnaexpress.com/test-article",
-            body=html_content,
-            encoding='utf-8'
-        )
-        
-        # Create a request with meta and assign to response
-        request = Request(
+        # Clone the shared pre-parsed response with this test's request
+        response = _RESP_WITH_CONTENT.replace(request=Request(
             url="https://theannapurnaexpress.com/test-article",
             meta={
                 'rss_title': 'Test Article from RSS',
                 'spider_start_time': '2023-01-01T00:00:00+00:00'
             }
-        )
-        response.request = request
+        ))
         
         # Execute parse_article
         articles = list(self.spider.parse_article(response))
@@ -149,34 +196,14 @@ class TestAnnapurnaSpider(unittest.TestCase):
 
     def test_parse_article_handles_missing_content(self):
         """Test parse_article method handles pages without content gracefully."""
-        # Create mock HTML response without the expected content
-        html_content = """
-        <html>
-            <body>
-                <h1>Test Article Title</h1>
-                <div class="different-class">
-                    <p>This content won't be found by our selector.</p>
-                </div>
-            </body>
-        </html>
-        """
-        
-        # Create mock response with meta data
-        response = HtmlResponse(
-            url="https://theannapurnaexpress.com/test-article",
-            body=html_content,
-            encoding='utf-8'
-        )
-        
-        # Create a request with meta and assign to response
-        request = Request(
+        # Clone the shared pre-parsed response with this test's request
+        response = _RESP_WITHOUT_CONTENT.replace(request=Request(
             url="https://theannapurnaexpress.com/test-article",
             meta={
                 'rss_title': 'Test Article from RSS',
                 'spider_start_time': '2023-01-01T00:00:00+00:00'
             }
-        )
-        response.request = request
+        ))
         
         # Execute parse_article
         articles = list(self.spider.parse_article(response))
@@ -186,28 +213,9 @@ class TestAnnapurnaSpider(unittest.TestCase):
 
     def test_extract_publication_date_from_meta_tag(self):
         """Test publication date extraction from meta tags."""
-        # Create mock HTML response with meta tag
-        html_content = """
-        <html>
-            <head>
-                <meta property="article:published_time" content="2023-01-01T12:00:00Z" />
-            </head>
-            <body>
-                <div class="single-content">
-                    <p>Test content</p>
-                </div>
-            </body>
-        </html>
-        """
-        
-        response = HtmlResponse(
-            url="https://theannapurnaexpress.com/test-article",
-            body=html_content,
-            encoding='utf-8'
-        )
-        
-        # Test the private method
-        publication_date = self.spider._extract_publication_date(response)
+        # The shared pre-parsed response needs no per-test request here
+        publication_date = self.spider._extract_publication_date(
+            _RESP_WITH_META_DATE)
         self.assertIsNotNone(publication_date)
         self.assertIn("2023-01-01", publication_date)
 
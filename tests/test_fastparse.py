@@ -0,0 +1,46 @@
+"""Unit tests for the selectolax-backed fast HTML extraction helpers."""
+
+import unittest
+
+from zerdisha_scrapers import fastparse
+
+
+class TestExtractParagraphs(unittest.TestCase):
+    """Test cases for the extract_paragraphs function."""
+
+    def test_extracts_matching_paragraph_text(self):
+        """Test that matching nodes are returned in document order."""
+        html = b"""
+        <html><body>
+            <div class="single-content">
+                <p>First paragraph.</p>
+                <p>Second <em>paragraph</em> with markup.</p>
+            </div>
+            <div class="other"><p>Not article content.</p></div>
+        </body></html>
+        """
+
+        paragraphs = fastparse.extract_paragraphs(html, 'div.single-content p')
+
+        self.assertEqual(paragraphs, [
+            "First paragraph.",
+            "Second paragraph with markup.",
+        ])
+
+    def test_repeat_queries_reuse_the_cached_tree(self):
+        """Test that two extractions on the same body parse only once."""
+        html = b"<html><body><p class='a'>One</p><p class='b'>Two</p></body></html>"
+        fastparse._get_tree.cache_clear()
+
+        fastparse.extract_paragraphs(html, 'p.a')
+        fastparse.extract_paragraphs(html, 'p.b')
+
+        self.assertGreaterEqual(fastparse._get_tree.cache_info().hits, 1)
+
+    def test_returns_empty_list_when_nothing_matches(self):
+        """Test that a selector with no matches returns an empty list."""
+        html = b"<html><body><p>Just a paragraph.</p></body></html>"
+
+        paragraphs = fastparse.extract_paragraphs(html, 'div.single-content p')
+
+        self.assertEqual(paragraphs, [])
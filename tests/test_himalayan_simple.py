@@ -5,7 +5,7 @@ focusing on core functionality without complex logger mocking.
 """
 
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 from datetime import datetime, timezone
 
 from scrapy.http import HtmlResponse, Request
@@ -13,12 +13,58 @@ from zerdisha_scrapers.spiders.himalayan import HimalayanSpider
 from zerdisha_scrapers.items import ArticleItem
 
 
+# Fixture body encoded once at import time so the test skips the
+# per-call str-to-bytes encoding inside HtmlResponse.
+_HTML_WITH_CONTENT = b"""
+<html>
+    <head><title>Test Article</title></head>
+    <body>
+        <h1>Sample Article Title</h1>
+        <div class="content-inner">
+            <p>First paragraph of the article.</p>
+            <p>Second paragraph with more content.</p>
+            <p>Third paragraph to test joining.</p>
+        </div>
+    </body>
+</html>
+"""
+
+# Response parsed once at import time; the parse test clones it with a
+# fresh request via .replace() instead of rebuilding HtmlResponse (and
+# its lxml tree) per test method.
+_RESP_WITH_CONTENT = HtmlResponse(
+    url="https://thehimalayantimes.com/test-article",
+    body=_HTML_WITH_CONTENT,
+    encoding='utf-8',
+)
+_RESP_WITH_CONTENT.selector  # force the parse eagerly
+
+
 class TestHimalayanSpider(unittest.TestCase):
     """Test cases for the HimalayanSpider class."""
     
+    SPIDER_CLS = HimalayanSpider
+
+    @classmethod
+    def setUpClass(cls):
+        """Construct one spider and start the class-wide feed patcher.
+
+        Starting the patcher once here instead of decorating each test
+        avoids paying patcher setup/teardown per method.
+        """
+        cls.spider = cls.SPIDER_CLS()
+        cls._iter_entries_patcher = patch(
+            'zerdisha_scrapers.spiders.himalayan.rss.iter_entries')
+        cls.mock_iter_entries = cls._iter_entries_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the class-wide feed patcher."""
+        cls._iter_entries_patcher.stop()
+
     def setUp(self):
-        """Set up test fixtures."""
-        self.spider = HimalayanSpider()
+        """Reset the shared feed mock between tests."""
+        self.mock_iter_entries.reset_mock(return_value=True, side_effect=True)
     
     def test_spider_attributes(self):
         """Test that spider has correct basic attributes."""
@@ -26,23 +72,19 @@ class TestHimalayanSpider(unittest.TestCase):
         self.assertEqual(self.spider.allowed_domains, ["thehimalayantimes.com"])
         self.assertEqual(self.spider.rss_url, "https://thehimalayantimes.com/feed")
     
-    @patch('zerdisha_scrapers.spiders.himalayan.feedparser.parse')
-    def test_start_requests_creates_requests_from_rss_feed(self, mock_feedparser):
+    def test_start_requests_creates_requests_from_rss_feed(self):
         """Test start_requests method creates requests from RSS feed."""
-        # Mock RSS feed response with two articles
-        mock_feed = Mock()
-        mock_feed.bozo = False
-        mock_feed.entries = [
-            Mock(
-                link="https://thehimalayantimes.com/article1",
-                title="Test Article 1"
-            ),
-            Mock(
-                link="https://thehimalayantimes.com/article2",
-                title="Test Article 2"
-            )
+        # Mock RSS entries as yielded by rss.iter_entries
+        self.mock_iter_entries.return_value = [
+            {
+                "link": "https://thehimalayantimes.com/article1",
+                "title": "Test Article 1"
+            },
+            {
+                "link": "https://thehimalayantimes.com/article2",
+                "title": "Test Article 2"
+            }
         ]
-        mock_feedparser.return_value = mock_feed
         
         # Execute start_requests
         requests = list(self.spider.start_requests())
@@ -62,14 +104,10 @@ class TestHimalayanSpider(unittest.TestCase):
         self.assertEqual(second_request.url, "https://thehimalayantimes.com/article2")
         self.assertEqual(second_request.meta['rss_title'], "Test Article 2")
     
-    @patch('zerdisha_scrapers.spiders.himalayan.feedparser.parse')
-    def test_start_requests_handles_empty_rss_feed(self, mock_feedparser):
+    def test_start_requests_handles_empty_rss_feed(self):
         """Test start_requests method handles empty RSS feed."""
-        # Mock empty RSS feed response
-        mock_feed = Mock()
-        mock_feed.bozo = False
-        mock_feed.entries = []
-        mock_feedparser.return_value = mock_feed
+        # Mock an RSS feed that yields no entries
+        self.mock_iter_entries.return_value = []
         
         # Execute start_requests
         requests = list(self.spider.start_requests())
@@ -77,22 +115,16 @@ class TestHimalayanSpider(unittest.TestCase):
         # Verify results
         self.assertEqual(len(requests), 0)
     
-    @patch('zerdisha_scrapers.spiders.himalayan.feedparser.parse')
-    def test_start_requests_skips_entries_without_links(self, mock_feedparser):
+    def test_start_requests_skips_entries_without_links(self):
         """Test start_requests method skips RSS entries without links."""
-        # Mock RSS feed with entry missing link
-        mock_feed = Mock()
-        mock_feed.bozo = False
-        mock_feed.entries = [
-            Mock(title="Test Article 1"),  # Missing link attribute
-            Mock(
-                link="https://thehimalayantimes.com/article2",
-                title="Test Article 2"
-            )
+        # Mock RSS feed with an entry missing its link
+        self.mock_iter_entries.return_value = [
+            {"title": "Test Article 1"},  # Missing link key
+            {
+                "link": "https://thehimalayantimes.com/article2",
+                "title": "Test Article 2"
+            }
         ]
-        # Remove link attribute from first entry
-        del mock_feed.entries[0].link
-        mock_feedparser.return_value = mock_feed
         
         # Execute start_requests
         requests = list(self.spider.start_requests())
@@ -103,31 +135,11 @@ class TestHimalayanSpider(unittest.TestCase):
     
     def test_parse_article_extracts_content_correctly(self):
         """Test parse_article method extracts content using correct CSS selector."""
-        # Create a mock response with article content
-        html_content = """
-        <html>
-            <head><title>Test Article</title></head>
-            <body>
-                <h1>Sample Article Title</h1>
-                <div class="content-inner">
-                    <p>First paragraph of the article.</p>
-                    <p>Second paragraph with more content.</p>
-                    <p>Third paragraph to test joining.</p>
-                </div>
-            </body>
-        </html>
-        """
-        
-        request = Request(
+        # Clone the shared pre-parsed response with this test's request
+        response = _RESP_WITH_CONTENT.replace(request=Request(
             url="https://thehimalayantimes.com/test-article",
             meta={'rss_title': 'Test Article From RSS'}
-        )
-        response = HtmlResponse(
-            url="https://thehimalayantimes.com/test-article",
-            body=html_content.encode('utf-8'),
-            encoding='utf-8',
-            request=request
-        )
+        ))
         
         # Execute parse_article
         articles = list(self.spider.parse_article(response))
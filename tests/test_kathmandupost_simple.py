@@ -5,101 +5,100 @@ focusing on core functionality without complex logger mocking.
 """
 
 import unittest
-from unittest.mock import Mock, patch
+
+from scrapy.http import XmlResponse
 
 from zerdisha_scrapers.spiders.kathmandupost import KathmandupostSpider
 
 
+def _feed_response(items: bytes) -> XmlResponse:
+    """Build an RSS feed response around the given <item> markup."""
+    body = (b'<?xml version="1.0" encoding="UTF-8"?>'
+            b'<rss version="2.0"><channel>' + items + b'</channel></rss>')
+    return XmlResponse(
+        url="https://kathmandupost.com/rss", body=body)
+
+
 class TestKathmandupostSpider(unittest.TestCase):
     """Test cases for the KathmandupostSpider class."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.spider = KathmandupostSpider()
-    
+
+    SPIDER_CLS = KathmandupostSpider
+
+    @classmethod
+    def setUpClass(cls):
+        """Construct one spider shared by every test."""
+        cls.spider = cls.SPIDER_CLS()
+
     def test_spider_attributes(self):
         """Test that spider has correct basic attributes."""
         self.assertEqual(self.spider.name, "kathmandupost")
         self.assertEqual(self.spider.allowed_domains, ["kathmandupost.com"])
         self.assertEqual(self.spider.rss_url, "https://kathmandupost.com/rss")
-    
-    @patch('zerdisha_scrapers.spiders.kathmandupost.feedparser.parse')
-    def test_start_requests_creates_requests_from_rss_feed(self, mock_feedparser):
-        """Test start_requests method creates requests from RSS feed."""
-        # Mock RSS feed response
-        mock_feed = Mock()
-        mock_feed.bozo = False
-        mock_feed.entries = [
-            Mock(
-                link="https://kathmandupost.com/article1",
-                title="Test Article 1",
-                published="Thu, 01 Jan 2023 12:00:00 GMT"
-            ),
-            Mock(
-                link="https://kathmandupost.com/article2", 
-                title="Test Article 2"
-            )
-        ]
-        mock_feedparser.return_value = mock_feed
-        
-        # Execute start_requests
+
+    def test_start_requests_yields_single_feed_request(self):
+        """Test start_requests dispatches the feed fetch to the downloader."""
         requests = list(self.spider.start_requests())
-        
+
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(requests[0].url, "https://kathmandupost.com/rss")
+        self.assertEqual(requests[0].callback, self.spider._parse_rss)
+        self.assertTrue(requests[0].dont_filter)
+
+    def test_parse_rss_creates_requests_from_feed(self):
+        """Test _parse_rss creates article requests from the feed body."""
+        response = _feed_response(
+            b'<item>'
+            b'<link>https://kathmandupost.com/article1</link>'
+            b'<title>Test Article 1</title>'
+            b'<pubDate>Thu, 01 Jan 2023 12:00:00 GMT</pubDate>'
+            b'</item>'
+            b'<item>'
+            b'<link>https://kathmandupost.com/article2</link>'
+            b'<title>Test Article 2</title>'
+            b'</item>')
+
+        # Execute _parse_rss
+        requests = list(self.spider._parse_rss(response))
+
         # Verify results
         self.assertEqual(len(requests), 2)
-        
+
         # Check first request
         first_request = requests[0]
         self.assertEqual(first_request.url, "https://kathmandupost.com/article1")
         self.assertEqual(first_request.callback, self.spider.parse_article)
         self.assertEqual(first_request.meta['rss_title'], "Test Article 1")
         self.assertEqual(first_request.meta['rss_publication_date'], "Thu, 01 Jan 2023 12:00:00 GMT")
-        self.assertIn('spider_start_time', first_request.meta)
-        
+        self.assertNotIn('spider_start_time', first_request.meta)
+
         # Check second request
         second_request = requests[1]
         self.assertEqual(second_request.url, "https://kathmandupost.com/article2")
         self.assertEqual(second_request.meta['rss_title'], "Test Article 2")
-    
-    @patch('zerdisha_scrapers.spiders.kathmandupost.feedparser.parse')
-    def test_start_requests_handles_empty_rss_feed(self, mock_feedparser):
-        """Test start_requests method handles empty RSS feed."""
-        # Mock empty RSS feed response
-        mock_feed = Mock()
-        mock_feed.bozo = False
-        mock_feed.entries = []
-        mock_feedparser.return_value = mock_feed
-        
-        # Execute start_requests
-        requests = list(self.spider.start_requests())
-        
+
+    def test_parse_rss_handles_empty_feed(self):
+        """Test _parse_rss handles an RSS feed with no entries."""
+        requests = list(self.spider._parse_rss(_feed_response(b'')))
+
         # Verify results
         self.assertEqual(len(requests), 0)
-    
-    @patch('zerdisha_scrapers.spiders.kathmandupost.feedparser.parse')
-    def test_start_requests_skips_entries_without_links(self, mock_feedparser):
-        """Test start_requests method skips RSS entries without links."""
-        # Mock RSS feed with entry missing link
-        mock_feed = Mock()
-        mock_feed.bozo = False
-        mock_feed.entries = [
-            Mock(title="Test Article 1"),  # Missing link attribute
-            Mock(
-                link="https://kathmandupost.com/article2",
-                title="Test Article 2"
-            )
-        ]
-        # Remove link attribute from first entry
-        del mock_feed.entries[0].link
-        mock_feedparser.return_value = mock_feed
-        
-        # Execute start_requests
-        requests = list(self.spider.start_requests())
-        
+
+    def test_parse_rss_skips_entries_without_links(self):
+        """Test _parse_rss skips RSS entries without links."""
+        response = _feed_response(
+            b'<item><title>Test Article 1</title></item>'  # Missing link
+            b'<item>'
+            b'<link>https://kathmandupost.com/article2</link>'
+            b'<title>Test Article 2</title>'
+            b'</item>')
+
+        # Execute _parse_rss
+        requests = list(self.spider._parse_rss(response))
+
         # Verify results - should skip entry without link
         self.assertEqual(len(requests), 1)
         self.assertEqual(requests[0].url, "https://kathmandupost.com/article2")
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -5,7 +5,7 @@ focusing on core functionality without complex logger mocking.
 """
 
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 from zerdisha_scrapers.spiders.nagarik import NagarikSpider
 
@@ -13,9 +13,28 @@ from zerdisha_scrapers.spiders.nagarik import NagarikSpider
 class TestNagarikSpider(unittest.TestCase):
     """Test cases for the NagarikSpider class."""
     
+    SPIDER_CLS = NagarikSpider
+
+    @classmethod
+    def setUpClass(cls):
+        """Construct one spider and start the class-wide feed patcher.
+
+        Starting the patcher once here instead of decorating each test
+        avoids paying patcher setup/teardown per method.
+        """
+        cls.spider = cls.SPIDER_CLS()
+        cls._iter_entries_patcher = patch(
+            'zerdisha_scrapers.spiders.nagarik.rss.iter_entries')
+        cls.mock_iter_entries = cls._iter_entries_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the class-wide feed patcher."""
+        cls._iter_entries_patcher.stop()
+
     def setUp(self):
-        """Set up test fixtures."""
-        self.spider = NagarikSpider()
+        """Reset the shared feed mock between tests."""
+        self.mock_iter_entries.reset_mock(return_value=True, side_effect=True)
     
     def test_spider_attributes(self):
         """Test that spider has correct basic attributes."""
@@ -23,23 +42,19 @@ class TestNagarikSpider(unittest.TestCase):
         self.assertEqual(self.spider.allowed_domains, ["nagariknetwork.com"])
         self.assertEqual(self.spider.rss_url, "https://nagariknews.nagariknetwork.com/feed")
     
-    @patch('zerdisha_scrapers.spiders.nagarik.feedparser.parse')
-    def test_start_requests_creates_requests_from_rss_feed(self, mock_feedparser):
+    def test_start_requests_creates_requests_from_rss_feed(self):
         """Test start_requests method creates requests from RSS feed."""
-        # Mock RSS feed response
-        mock_feed = Mock()
-        mock_feed.bozo = False
-        mock_feed.entries = [
-            Mock(
-                link="https://nagariknews.nagariknetwork.com/article1",
-                title="Test Article 1"
-            ),
-            Mock(
-                link="https://nagariknews.nagariknetwork.com/article2", 
-                title="Test Article 2"
-            )
+        # Mock RSS entries as yielded by rss.iter_entries
+        self.mock_iter_entries.return_value = [
+            {
+                "link": "https://nagariknews.nagariknetwork.com/article1",
+                "title": "Test Article 1"
+            },
+            {
+                "link": "https://nagariknews.nagariknetwork.com/article2",
+                "title": "Test Article 2"
+            }
         ]
-        mock_feedparser.return_value = mock_feed
         
         # Execute start_requests
         requests = list(self.spider.start_requests())
@@ -59,14 +74,10 @@ class TestNagarikSpider(unittest.TestCase):
         self.assertEqual(second_request.url, "https://nagariknews.nagariknetwork.com/article2")
         self.assertEqual(second_request.meta['rss_title'], "Test Article 2")
     
-    @patch('zerdisha_scrapers.spiders.nagarik.feedparser.parse')
-    def test_start_requests_handles_empty_rss_feed(self, mock_feedparser):
+    def test_start_requests_handles_empty_rss_feed(self):
         """Test start_requests method handles empty RSS feed."""
-        # Mock empty RSS feed response
-        mock_feed = Mock()
-        mock_feed.bozo = False
-        mock_feed.entries = []
-        mock_feedparser.return_value = mock_feed
+        # Mock an RSS feed that yields no entries
+        self.mock_iter_entries.return_value = []
         
         # Execute start_requests
         requests = list(self.spider.start_requests())
@@ -74,22 +85,16 @@ class TestNagarikSpider(unittest.TestCase):
         # Verify results
         self.assertEqual(len(requests), 0)
     
-    @patch('zerdisha_scrapers.spiders.nagarik.feedparser.parse')
-    def test_start_requests_skips_entries_without_links(self, mock_feedparser):
+    def test_start_requests_skips_entries_without_links(self):
         """Test start_requests method skips RSS entries without links."""
-        # Mock RSS feed with entry missing link
-        mock_feed = Mock()
-        mock_feed.bozo = False
-        mock_feed.entries = [
-            Mock(title="Test Article 1"),  # Missing link attribute
-            Mock(
-                link="https://nagariknews.nagariknetwork.com/article2",
-                title="Test Article 2"
-            )
+        # Mock RSS feed with an entry missing its link
+        self.mock_iter_entries.return_value = [
+            {"title": "Test Article 1"},  # Missing link key
+            {
+                "link": "https://nagariknews.nagariknetwork.com/article2",
+                "title": "Test Article 2"
+            }
         ]
-        # Remove link attribute from first entry
-        del mock_feed.entries[0].link
-        mock_feedparser.return_value = mock_feed
         
         # Execute start_requests
         requests = list(self.spider.start_requests())
@@ -4,29 +4,63 @@ This module contains comprehensive tests for all pipeline classes,
 ensuring proper validation, cleaning, and timestamp handling functionality.
 """
 
+import json
+import os
+import tempfile
 import unittest
 from datetime import datetime, timezone
-from unittest.mock import MagicMock
 
+import pytest
 from scrapy.exceptions import DropItem
 
 from zerdisha_scrapers.items import ArticleItem
 from zerdisha_scrapers.pipelines import (
+    BatchedJsonWriterPipeline,
     ValidationPipeline,
     CleaningPipeline,
     TimestampPipeline,
 )
 
 
+class _StubLogger:
+    """Call-counting logger stand-in.
+
+    MagicMock builds a recursive spec on first attribute access; this
+    stub is a plain object with two counters, which keeps per-test setUp
+    cost negligible as parametrization multiplies cases.
+    """
+
+    def __init__(self):
+        self.debug_calls = 0
+        self.warning_calls = 0
+
+    def debug(self, *args, **kwargs):
+        self.debug_calls += 1
+
+    def warning(self, *args, **kwargs):
+        self.warning_calls += 1
+
+    def isEnabledFor(self, level):
+        return True
+
+
+class _StubSpider:
+    """Minimal spider stand-in exposing just a name and a logger."""
+
+    name = 'test_spider'
+
+    def __init__(self):
+        self.logger = _StubLogger()
+
+
+
 class TestValidationPipeline(unittest.TestCase):
     """Test cases for the ValidationPipeline class."""
     
     def setUp(self):
         """Set up test fixtures."""
         self.pipeline = ValidationPipeline()
-        self.spider = MagicMock()
-        self.spider.name = "test_spider"
-        self.spider.logger = MagicMock()
+        self.spider = _StubSpider()
     
     def test_valid_item_passes_validation(self):
         """Test that a valid item passes validation."""
@@ -42,87 +76,52 @@ class TestValidationPipeline(unittest.TestCase):
         result = self.pipeline.process_item(item, self.spider)
         
         self.assertEqual(result, item)
-        self.spider.logger.debug.assert_called_once()
-    
-    def test_missing_url_raises_drop_item(self):
-        """Test that missing URL field raises DropItem."""
-        item = ArticleItem()
-        item['title'] = 'Test Article Title'
-        item['full_text'] = 'This is the full article content.'
-        item['source_name'] = 'Test Source'
-        
-        with self.assertRaises(DropItem) as context:
-            self.pipeline.process_item(item, self.spider)
-        
-        self.assertIn("Missing essential field 'url'", str(context.exception))
-        self.spider.logger.warning.assert_called_once()
-    
-    def test_missing_title_raises_drop_item(self):
-        """Test that missing title field raises DropItem."""
-        item = ArticleItem()
-        item['url'] = 'https://example.com/article'
-        item['full_text'] = 'This is the full article content.'
-        item['source_name'] = 'Test Source'
-        
-        with self.assertRaises(DropItem) as context:
-            self.pipeline.process_item(item, self.spider)
-        
-        self.assertIn("Missing essential field 'title'", str(context.exception))
-        self.spider.logger.warning.assert_called_once()
-    
-    def test_missing_full_text_raises_drop_item(self):
-        """Test that missing full_text field raises DropItem."""
-        item = ArticleItem()
-        item['url'] = 'https://example.com/article'
-        item['title'] = 'Test Article Title'
-        item['source_name'] = 'Test Source'
-        
-        with self.assertRaises(DropItem) as context:
-            self.pipeline.process_item(item, self.spider)
-        
-        self.assertIn("Missing essential field 'full_text'", str(context.exception))
-        self.spider.logger.warning.assert_called_once()
-    
-    def test_missing_source_name_raises_drop_item(self):
-        """Test that missing source_name field raises DropItem."""
-        item = ArticleItem()
-        item['url'] = 'https://example.com/article'
-        item['title'] = 'Test Article Title'
-        item['full_text'] = 'This is the full article content.'
-        
-        with self.assertRaises(DropItem) as context:
-            self.pipeline.process_item(item, self.spider)
-        
-        self.assertIn("Missing essential field 'source_name'", str(context.exception))
-        self.spider.logger.warning.assert_called_once()
+        self.assertEqual(self.spider.logger.debug_calls, 1)
     
-    def test_empty_string_fields_raise_drop_item(self):
-        """Test that empty string fields raise DropItem."""
-        item = ArticleItem()
-        item['url'] = 'https://example.com/article'
-        item['title'] = '   '  # Only whitespace
-        item['full_text'] = 'This is the full article content.'
-        item['source_name'] = 'Test Source'
-        
-        with self.assertRaises(DropItem) as context:
-            self.pipeline.process_item(item, self.spider)
-        
-        self.assertIn("Empty essential field 'title'", str(context.exception))
-        self.spider.logger.warning.assert_called_once()
-    
-    def test_whitespace_only_fields_raise_drop_item(self):
-        """Test that fields with only whitespace raise DropItem."""
-        item = ArticleItem()
-        item['url'] = ''  # Empty string
-        item['title'] = 'Test Article Title'
-        item['full_text'] = 'This is the full article content.'
-        item['source_name'] = 'Test Source'
-        
-        with self.assertRaises(DropItem) as context:
-            self.pipeline.process_item(item, self.spider)
-        
-        self.assertIn("Empty essential field 'url'", str(context.exception))
-        self.spider.logger.warning.assert_called_once()
+
+def _make_valid_item() -> ArticleItem:
+    """Build an item populated with every essential field."""
+    item = ArticleItem()
+    item['url'] = 'https://example.com/article'
+    item['title'] = 'Test Article Title'
+    item['full_text'] = 'This is the full article content.'
+    item['source_name'] = 'Test Source'
+    return item
+
+
+def _make_spider() -> _StubSpider:
+    """Build a stub spider with a name and logger."""
+    return _StubSpider()
+
+
+@pytest.mark.parametrize(
+    'missing_field', ['url', 'title', 'full_text', 'source_name'])
+def test_missing_essential_field_raises_drop_item(missing_field):
+    """Test that each missing essential field raises DropItem."""
+    item = _make_valid_item()
+    item[missing_field] = None
+    spider = _make_spider()
+
+    with pytest.raises(
+            DropItem,
+            match=f"Missing or empty essential field '{missing_field}'"):
+        ValidationPipeline().process_item(item, spider)
+
+    assert spider.logger.warning_calls == 1
+
+
+@pytest.mark.parametrize('field,value', [('url', ''), ('title', '   ')])
+def test_empty_essential_field_raises_drop_item(field, value):
+    """Test that empty or whitespace-only essential fields raise DropItem."""
+    item = _make_valid_item()
+    item[field] = value
+    spider = _make_spider()
+
+    with pytest.raises(
+            DropItem, match=f"Missing or empty essential field '{field}'"):
+        ValidationPipeline().process_item(item, spider)
+
+    assert spider.logger.warning_calls == 1
 
 
 class TestCleaningPipeline(unittest.TestCase):
@@ -131,9 +130,7 @@ class TestCleaningPipeline(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.pipeline = CleaningPipeline()
-        self.spider = MagicMock()
-        self.spider.name = "test_spider"
-        self.spider.logger = MagicMock()
+        self.spider = _StubSpider()
     
     def test_strips_whitespace_from_strings(self):
         """Test that leading and trailing whitespace is stripped."""
@@ -151,7 +148,7 @@ class TestCleaningPipeline(unittest.TestCase):
         self.assertEqual(result['full_text'], 'This is the full article content.')
         self.assertEqual(result['source_name'], 'Test Source')
         self.assertEqual(result['author'], 'Test Author')
-        self.spider.logger.debug.assert_called_once()
+        self.assertEqual(self.spider.logger.debug_calls, 1)
     
     def test_normalizes_unicode_strings(self):
         """Test that Unicode strings are normalized to NFC form."""
@@ -168,7 +165,7 @@ class TestCleaningPipeline(unittest.TestCase):
         # but we can verify the function completes successfully
         self.assertIsInstance(result['title'], str)
         self.assertIsInstance(result['full_text'], str)
-        self.spider.logger.debug.assert_called_once()
+        self.assertEqual(self.spider.logger.debug_calls, 1)
     
     def test_handles_non_string_fields(self):
         """Test that non-string fields are left unchanged."""
@@ -182,7 +179,7 @@ class TestCleaningPipeline(unittest.TestCase):
         result = self.pipeline.process_item(item, self.spider)
         
         self.assertIsNone(result['publication_date'])
-        self.spider.logger.debug.assert_called_once()
+        self.assertEqual(self.spider.logger.debug_calls, 1)
     
     def test_empty_strings_remain_empty(self):
         """Test that empty strings remain empty after cleaning."""
@@ -196,7 +193,7 @@ class TestCleaningPipeline(unittest.TestCase):
         result = self.pipeline.process_item(item, self.spider)
         
         self.assertEqual(result['author'], '')
-        self.spider.logger.debug.assert_called_once()
+        self.assertEqual(self.spider.logger.debug_calls, 1)
 
 
 class TestTimestampPipeline(unittest.TestCase):
@@ -205,9 +202,7 @@ class TestTimestampPipeline(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.pipeline = TimestampPipeline()
-        self.spider = MagicMock()
-        self.spider.name = "test_spider"
-        self.spider.logger = MagicMock()
+        self.spider = _StubSpider()
     
     def test_datetime_objects_converted_to_iso_format(self):
         """Test that datetime objects are converted to ISO 8601 strings."""
@@ -226,7 +221,7 @@ class TestTimestampPipeline(unittest.TestCase):
         
         self.assertEqual(result['publication_date'], '2023-01-01T12:00:00+00:00')
         self.assertEqual(result['scraped_at'], '2023-01-01T12:00:00+00:00')
-        self.spider.logger.debug.assert_called_once()
+        self.assertEqual(self.spider.logger.debug_calls, 1)
     
     def test_iso_format_strings_validated_and_standardized(self):
         """Test that valid ISO format strings are validated and standardized."""
@@ -243,7 +238,7 @@ class TestTimestampPipeline(unittest.TestCase):
         # Should standardize Z timezone notation
         self.assertEqual(result['publication_date'], '2023-01-01T12:00:00+00:00')
         self.assertEqual(result['scraped_at'], '2023-01-01T12:00:00+00:00')
-        self.spider.logger.debug.assert_called_once()
+        self.assertEqual(self.spider.logger.debug_calls, 1)
     
     def test_common_date_formats_converted(self):
         """Test that common date formats are converted to ISO 8601."""
@@ -259,7 +254,7 @@ class TestTimestampPipeline(unittest.TestCase):
         
         self.assertEqual(result['publication_date'], '2023-01-01T12:00:00')
         self.assertEqual(result['scraped_at'], '2023-01-01T00:00:00')
-        self.spider.logger.debug.assert_called_once()
+        self.assertEqual(self.spider.logger.debug_calls, 1)
     
     def test_invalid_date_formats_logged_and_preserved(self):
         """Test that invalid date formats are logged and original value preserved."""
@@ -276,8 +271,8 @@ class TestTimestampPipeline(unittest.TestCase):
         # Invalid date should be preserved as-is
         self.assertEqual(result['publication_date'], 'invalid date string')
         self.assertEqual(result['scraped_at'], '2023-01-01T12:00:00')
-        self.spider.logger.warning.assert_called_once()
-        self.spider.logger.debug.assert_called_once()
+        self.assertEqual(self.spider.logger.warning_calls, 1)
+        self.assertEqual(self.spider.logger.debug_calls, 1)
     
     def test_none_values_handled_gracefully(self):
         """Test that None values in timestamp fields are handled gracefully."""
@@ -293,7 +288,7 @@ class TestTimestampPipeline(unittest.TestCase):
         
         self.assertIsNone(result['publication_date'])
         self.assertEqual(result['scraped_at'], '2023-01-01T12:00:00')
-        self.spider.logger.debug.assert_called_once()
+        self.assertEqual(self.spider.logger.debug_calls, 1)
     
     def test_standardize_timestamp_method_with_various_formats(self):
         """Test the _standardize_timestamp method with various input formats."""
@@ -323,5 +318,65 @@ class TestTimestampPipeline(unittest.TestCase):
             self.pipeline._standardize_timestamp("12345")
 
 
+class TestBatchedJsonWriterPipeline(unittest.TestCase):
+    """Test cases for the BatchedJsonWriterPipeline class."""
+
+    def setUp(self):
+        """Set up a writer flushing every two items to a temp file."""
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmpdir.name, 'items.jsonl')
+        self.pipeline = BatchedJsonWriterPipeline(self.path, batch_size=2)
+        self.spider = _StubSpider()
+        self.pipeline.open_spider(self.spider)
+
+    def tearDown(self):
+        """Close the writer and clean up the temp directory."""
+        self.pipeline.close_spider(self.spider)
+        self._tmpdir.cleanup()
+
+    def _item(self, url):
+        """Build a minimal valid ArticleItem for the given URL."""
+        return ArticleItem(
+            url=url,
+            source_name='Test Source',
+            title='Test Article',
+            full_text='Test content.',
+            spider_name='test_spider',
+        )
+
+    def _written_lines(self):
+        """Read back the JSON lines written so far."""
+        with open(self.path, 'rb') as written:
+            return [json.loads(line) for line in written if line.strip()]
+
+    def test_items_buffer_until_batch_is_full(self):
+        """Test that no write happens before the batch size is reached."""
+        self.pipeline.process_item(self._item('https://example.com/1'), self.spider)
+
+        self.assertEqual(self._written_lines(), [])
+
+        self.pipeline.process_item(self._item('https://example.com/2'), self.spider)
+
+        lines = self._written_lines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[0]['url'], 'https://example.com/1')
+        self.assertEqual(lines[1]['title'], 'Test Article')
+
+    def test_close_spider_flushes_remnants(self):
+        """Test that a partial batch is written when the spider closes."""
+        item = self.pipeline.process_item(
+            self._item('https://example.com/1'), self.spider)
+
+        # The item passes through unchanged for downstream pipelines.
+        self.assertEqual(item['url'], 'https://example.com/1')
+
+        self.pipeline.close_spider(self.spider)
+
+        lines = self._written_lines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(lines[0]['url'], 'https://example.com/1')
+        self.assertIsNone(lines[0]['author'])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
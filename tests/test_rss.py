@@ -0,0 +1,294 @@
+"""Unit tests for the streaming RSS parsing helpers.
+
+This module contains tests for the rss module, covering streaming entry
+extraction with iter_entries and pubDate parsing with parse_pubdate.
+"""
+
+import io
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from zerdisha_scrapers import http, rss
+
+
+SAMPLE_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>Test Feed</title>
+    <item>
+      <link>https://example.com/article1</link>
+      <title>Test Article 1</title>
+      <pubDate>Thu, 01 Jan 2023 12:00:00 GMT</pubDate>
+    </item>
+    <item>
+      <link>https://example.com/article2</link>
+      <title>Test Article 2</title>
+    </item>
+  </channel>
+</rss>
+"""
+
+
+def _feed_response(body=SAMPLE_FEED, status_code=200, headers=None):
+    """Build a lightweight stand-in for a requests response.
+
+    SimpleNamespace is far cheaper to construct than a Mock and keeps the
+    fixture attributes explicit.
+    """
+    return SimpleNamespace(
+        raw=io.BytesIO(body),
+        content=body,
+        status_code=status_code,
+        headers=headers or {},
+        raise_for_status=lambda: None,
+    )
+
+
+class TestIterEntries(unittest.TestCase):
+    """Test cases for the iter_entries function."""
+
+    @patch('zerdisha_scrapers.http.SESSION.get')
+    def test_iter_entries_yields_entry_dicts(self, mock_get):
+        """Test that iter_entries streams entry dicts from the feed."""
+        mock_get.return_value = _feed_response()
+
+        entries = list(rss.iter_entries("https://example.com/rss"))
+
+        self.assertEqual(len(entries), 2)
+
+        first = entries[0]
+        self.assertEqual(first['link'], "https://example.com/article1")
+        self.assertEqual(first['title'], "Test Article 1")
+        self.assertEqual(first['published'], "Thu, 01 Jan 2023 12:00:00 GMT")
+        self.assertIsNotNone(first['published_parsed'])
+        self.assertEqual(first['published_parsed'].year, 2023)
+
+        second = entries[1]
+        self.assertEqual(second['link'], "https://example.com/article2")
+        self.assertIsNone(second['published'])
+        self.assertIsNone(second['published_parsed'])
+
+    @patch('zerdisha_scrapers.http.SESSION.get')
+    def test_iter_entries_handles_feed_without_items(self, mock_get):
+        """Test that iter_entries yields nothing for an item-less feed."""
+        mock_get.return_value = _feed_response(
+            b'<?xml version="1.0"?><rss version="2.0"><channel></channel></rss>')
+
+        entries = list(rss.iter_entries("https://example.com/rss"))
+
+        self.assertEqual(entries, [])
+
+
+class TestParseRss2(unittest.TestCase):
+    """Test cases for the parse_rss2 function."""
+
+    def test_parses_feed_bytes_directly(self):
+        """Test that a prefetched byte body parses without a URL."""
+        entries = list(rss.parse_rss2(SAMPLE_FEED))
+
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(entries[0]['link'], "https://example.com/article1")
+        self.assertEqual(entries[1]['title'], "Test Article 2")
+
+    def test_max_entries_aborts_parsing_early(self):
+        """Test that max_entries caps the yielded entries."""
+        items = b''.join(
+            b'<item><link>https://example.com/article%d</link></item>' % i
+            for i in range(100))
+        feed = (b'<?xml version="1.0"?><rss version="2.0"><channel>'
+                + items + b'</channel></rss>')
+
+        entries = list(rss.parse_rss2(feed, max_entries=50))
+
+        self.assertEqual(len(entries), 50)
+        self.assertEqual(entries[-1]['link'], "https://example.com/article49")
+
+    def test_skippable_fields_default_to_none(self):
+        """Test that missing item children come back as None."""
+        feed = (b'<?xml version="1.0"?><rss version="2.0"><channel>'
+                b'<item><title>No link here</title></item>'
+                b'</channel></rss>')
+
+        entries = list(rss.parse_rss2(feed))
+
+        self.assertEqual(len(entries), 1)
+        self.assertIsNone(entries[0]['link'])
+
+
+class TestPrefetchFeeds(unittest.TestCase):
+    """Test cases for the prefetch_feeds helper."""
+
+    def tearDown(self):
+        """Drop any leftover prefetched bodies between tests."""
+        rss._PREFETCH_CACHE.clear()
+
+    @patch('zerdisha_scrapers.http.SESSION.get')
+    def test_prefetched_body_is_parsed_without_refetching(self, mock_get):
+        """Test that iter_entries consumes the prefetched body."""
+        mock_get.return_value = _feed_response()
+
+        fetched = rss.prefetch_feeds(["https://example.com/rss"])
+
+        self.assertEqual(fetched, {"https://example.com/rss": SAMPLE_FEED})
+        self.assertEqual(mock_get.call_count, 1)
+
+        entries = list(rss.iter_entries("https://example.com/rss"))
+
+        # The parse consumed the cached body instead of fetching again.
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertNotIn("https://example.com/rss", rss._PREFETCH_CACHE)
+
+    @patch('zerdisha_scrapers.http.SESSION.get')
+    def test_failed_prefetch_is_omitted(self, mock_get):
+        """Test that a failing feed is logged and left out of the result."""
+        mock_get.side_effect = IOError("connection refused")
+
+        fetched = rss.prefetch_feeds(["https://example.com/rss"])
+
+        self.assertEqual(fetched, {})
+
+
+class TestConditionalGet(unittest.TestCase):
+    """Test cases for ETag / Last-Modified conditional feed fetching."""
+
+    def setUp(self):
+        """Set up a temporary state directory."""
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.state_dir = self._tmpdir.name
+
+    def tearDown(self):
+        """Clean up the temporary state directory."""
+        self._tmpdir.cleanup()
+
+    @patch('zerdisha_scrapers.http.SESSION.get')
+    def test_not_modified_feed_yields_no_entries(self, mock_get):
+        """Test that a 304 response short-circuits without parsing."""
+        mock_get.return_value = _feed_response(status_code=304)
+
+        entries = list(rss.iter_entries(
+            "https://example.com/rss",
+            state_key="test_spider",
+            state_dir=self.state_dir,
+        ))
+
+        self.assertEqual(entries, [])
+
+    @patch('zerdisha_scrapers.http.SESSION.get')
+    def test_validators_persisted_and_sent_on_next_poll(self, mock_get):
+        """Test that ETag/Last-Modified round-trip through the state file."""
+        validators = {
+            "ETag": '"abc123"',
+            "Last-Modified": "Thu, 01 Jan 2023 12:00:00 GMT",
+        }
+        mock_get.side_effect = [
+            _feed_response(headers=validators),
+            _feed_response(headers=validators),
+        ]
+
+        list(rss.iter_entries(
+            "https://example.com/rss",
+            state_key="test_spider",
+            state_dir=self.state_dir,
+        ))
+
+        list(rss.iter_entries(
+            "https://example.com/rss",
+            state_key="test_spider",
+            state_dir=self.state_dir,
+        ))
+
+        headers = mock_get.call_args[1]['headers']
+        self.assertEqual(headers["If-None-Match"], '"abc123"')
+        self.assertEqual(
+            headers["If-Modified-Since"], "Thu, 01 Jan 2023 12:00:00 GMT")
+
+    @patch('zerdisha_scrapers.http.SESSION.get')
+    def test_first_poll_sends_no_conditional_headers(self, mock_get):
+        """Test that the first fetch for a feed is unconditional."""
+        mock_get.return_value = _feed_response()
+
+        list(rss.iter_entries(
+            "https://example.com/rss",
+            state_key="test_spider",
+            state_dir=self.state_dir,
+        ))
+
+        self.assertEqual(mock_get.call_args[1]['headers'], {})
+
+
+class TestSharedSession(unittest.TestCase):
+    """Test cases for the shared pooled HTTP session."""
+
+    @patch('zerdisha_scrapers.http.SESSION.get')
+    def test_back_to_back_fetches_reuse_one_session(self, mock_get):
+        """Test that consecutive feed fetches go through the same session."""
+        mock_get.side_effect = [_feed_response(), _feed_response()]
+
+        list(rss.iter_entries("https://example.com/rss"))
+        list(rss.iter_entries("https://example.com/rss"))
+
+        # Both fetches hit the single module-level session, so keep-alive
+        # can amortize connection setup across polls.
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_session_sends_compressed_transfer_header(self):
+        """Test that the shared session asks for compressed responses."""
+        self.assertIn("gzip", http.SESSION.headers["Accept-Encoding"])
+
+
+class TestSeenGuids(unittest.TestCase):
+    """Test cases for the persistent seen-GUID helpers."""
+
+    def setUp(self):
+        """Set up a temporary state directory."""
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.state_dir = self._tmpdir.name
+
+    def tearDown(self):
+        """Clean up the temporary state directory."""
+        self._tmpdir.cleanup()
+
+    def test_seen_guids_round_trip(self):
+        """Test that saved GUIDs come back on the next load."""
+        guids = {"https://example.com/article1", "https://example.com/article2"}
+
+        rss.save_seen_guids("test_spider", guids, state_dir=self.state_dir)
+        loaded = rss.load_seen_guids("test_spider", state_dir=self.state_dir)
+
+        self.assertEqual(loaded, guids)
+
+    def test_load_without_state_returns_empty_set(self):
+        """Test that the first poll starts from an empty seen set."""
+        self.assertEqual(
+            rss.load_seen_guids("test_spider", state_dir=self.state_dir), set())
+
+
+class TestParsePubdate(unittest.TestCase):
+    """Test cases for the parse_pubdate function."""
+
+    def test_parses_rfc822_date_with_gmt(self):
+        """Test that standard RFC 822 pubDate strings are parsed."""
+        parsed = rss.parse_pubdate("Thu, 01 Jan 2023 12:00:00 GMT")
+
+        self.assertIsNotNone(parsed)
+        self.assertEqual(parsed.isoformat(), "2023-01-01T12:00:00+00:00")
+
+    def test_parses_nepal_time_abbreviation(self):
+        """Test that the NPT timezone abbreviation resolves via TZMAP."""
+        parsed = rss.parse_pubdate("Thu, 01 Jan 2023 12:00:00 NPT")
+
+        self.assertIsNotNone(parsed)
+        self.assertIsNotNone(parsed.tzinfo)
+        self.assertEqual(parsed.utcoffset().total_seconds(), 5 * 3600 + 45 * 60)
+
+    def test_returns_none_for_unparseable_date(self):
+        """Test that garbage pubDate values return None instead of raising."""
+        self.assertIsNone(rss.parse_pubdate("not a date"))
+
+    def test_returns_none_for_missing_date(self):
+        """Test that None/empty input returns None."""
+        self.assertIsNone(rss.parse_pubdate(None))
+        self.assertIsNone(rss.parse_pubdate(""))
@@ -0,0 +1,43 @@
+"""Cached CSS-to-XPath translation for hot selector call sites.
+
+``response.css(...)`` re-translates the CSS expression to XPath on every
+call, and that translation is a measurable slice of per-article parse
+time. The helpers here wrap parsel's translator in an ``lru_cache`` so
+each distinct selector string is compiled exactly once per process, and
+subsequent lookups are a dict probe.
+"""
+
+from functools import lru_cache
+
+from parsel.csstranslator import HTMLTranslator
+
+_TRANSLATOR = HTMLTranslator()
+
+
+@lru_cache(maxsize=256)
+def css_to_xpath(query: str) -> str:
+    """Translate a CSS selector to its XPath equivalent, with caching.
+
+    Args:
+        query: A CSS selector, including parsel extensions such as
+            ``::text`` and ``::attr(...)``.
+
+    Returns:
+        The translated XPath expression.
+    """
+    return _TRANSLATOR.css_to_xpath(query)
+
+
+def css(response, query: str):
+    """Run a CSS selector through the cached XPath translation.
+
+    Drop-in replacement for ``response.css(query)`` on hot paths.
+
+    Args:
+        response: A Scrapy response or parsel selector.
+        query: The CSS selector to evaluate.
+
+    Returns:
+        The matching SelectorList, as ``response.css`` would return.
+    """
+    return response.xpath(css_to_xpath(query))
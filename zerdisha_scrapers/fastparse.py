@@ -0,0 +1,61 @@
+"""Fast HTML text extraction helpers backed by selectolax.
+
+selectolax wraps the Modest C engine, which traverses tag/attribute
+structures noticeably faster than a generic lxml selector pass. The
+helpers here provide a fast path for the spiders' content-extraction
+step; callers fall back to their lxml/parsel selectors when selectolax
+is not installed or a page yields no matches, so behaviour is unchanged
+when the fast path cannot be used.
+"""
+
+import logging
+from functools import lru_cache
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # pragma: no cover - exercised only without selectolax
+    HTMLParser = None
+    logger.debug("selectolax not available, HTML fast path disabled")
+
+
+@lru_cache(maxsize=128)
+def _get_tree(html_bytes: bytes) -> "HTMLParser":
+    """Build (or fetch the memoized) selectolax tree for a document body.
+
+    Multiple selector queries against the same response body share one
+    parse: the tree for a given byte string is built once and reused via
+    the cache, keyed directly on the (hashable) bytes.
+
+    Args:
+        html_bytes: The raw HTML document body.
+
+    Returns:
+        The parsed selectolax tree for the document.
+    """
+    return HTMLParser(html_bytes)
+
+
+def extract_paragraphs(html_bytes: bytes, css: str) -> List[str]:
+    """Extract the text of every node matching a CSS selector.
+
+    Args:
+        html_bytes: The raw HTML document body.
+        css: A CSS selector for the content nodes (e.g.
+            ``'div.single-content p'``).
+
+    Returns:
+        The text content of each matching node in document order. Empty
+        when nothing matches or the selectolax fast path is unavailable,
+        in which case callers should fall back to their lxml selectors.
+    """
+    if HTMLParser is None:
+        return []
+
+    tree: Optional[HTMLParser] = _get_tree(html_bytes)
+    if tree.body is None:
+        return []
+
+    return [node.text() for node in tree.css(css)]
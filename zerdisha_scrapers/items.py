@@ -4,17 +4,40 @@ This module defines the data contracts used by spiders to structure
 and validate scraped data. All items follow strict typing conventions
 and include comprehensive field documentation.
 
+ArticleItem is a plain ``__slots__`` class rather than a ``scrapy.Item``:
+field access is a C-level slot lookup instead of a metaclass-validated
+dict probe, and instances carry no per-object ``__dict__``, roughly
+halving per-item memory for this known-shape, high-volume record. A
+small adapter registered with itemadapter keeps Scrapy's exporters and
+``is_item`` checks working, and dict-style indexing is preserved for
+existing call sites.
+
 See documentation:
 https://docs.scrapy.org/en/latest/topics/items.html
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Iterator, List, Optional, Union
+
+from itemadapter.adapter import AdapterInterface, ItemAdapter
 
-import scrapy
+#: All ArticleItem field names, in canonical export order.
+FIELDS = (
+    'url',
+    'source_name',
+    'title',
+    'full_text',
+    'author',
+    'publication_date',
+    'scraped_at',
+    'spider_name',
+)
 
+# Pre-hashed for O(1) field-name validation in the dict-style accessors.
+_FIELD_SET = frozenset(FIELDS)
 
-class ArticleItem(scrapy.Item):
+
+class ArticleItem:
     """Core data structure for news articles scraped from various sources.
 
     This item represents a standardized format for all news articles
@@ -24,6 +47,10 @@ class ArticleItem(scrapy.Item):
     All date fields are timezone-aware and serialized as ISO 8601 strings
     to maintain consistency and enable proper temporal analysis.
 
+    Unset fields read as None; dict-style indexing (``item['url']``) is
+    supported alongside attribute access for compatibility with the
+    previous ``scrapy.Item`` interface.
+
     Fields:
         url: The canonical URL of the article.
         source_name: Name of the news source/publication.
@@ -35,46 +62,109 @@ class ArticleItem(scrapy.Item):
         spider_name: Name of the spider that collected this article.
     """
 
-    # Article identification and source
-    url = scrapy.Field(
-        serializer=str,
-        doc="The canonical URL where this article was found"
-    )
-
-    source_name = scrapy.Field(
-        serializer=str,
-        doc="Name of the news source or publication (e.g., 'BBC News', 'Reuters')"
-    )
-
-    # Article content
-    title = scrapy.Field(
-        serializer=str,
-        doc="The article's headline or title"
-    )
-
-    full_text = scrapy.Field(
-        serializer=str,
-        doc="Complete article body text, cleaned of HTML and formatting"
-    )
-
-    author = scrapy.Field(
-        serializer=str,
-        doc="Article author name(s), if available"
-    )
-
-    # Temporal information (timezone-aware, ISO 8601 format)
-    publication_date = scrapy.Field(
-        serializer=str,
-        doc="Original publication date as ISO 8601 string (timezone-aware)"
-    )
-
-    scraped_at = scrapy.Field(
-        serializer=str,
-        doc="Timestamp when this article was scraped as ISO 8601 string (timezone-aware)"
-    )
-
-    # Metadata
-    spider_name = scrapy.Field(
-        serializer=str,
-        doc="Name of the spider that collected this article"
-    )
+    __slots__ = FIELDS
+
+    url: Optional[str]
+    source_name: Optional[str]
+    title: Optional[str]
+    full_text: Optional[str]
+    author: Optional[str]
+    publication_date: Optional[Union[str, datetime]]
+    scraped_at: Optional[Union[str, datetime]]
+    spider_name: Optional[str]
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        source_name: Optional[str] = None,
+        title: Optional[str] = None,
+        full_text: Optional[str] = None,
+        author: Optional[str] = None,
+        publication_date: Optional[Union[str, datetime]] = None,
+        scraped_at: Optional[Union[str, datetime]] = None,
+        spider_name: Optional[str] = None,
+    ) -> None:
+        """Initialize the item, defaulting every field to None."""
+        self.url = url
+        self.source_name = source_name
+        self.title = title
+        self.full_text = full_text
+        self.author = author
+        self.publication_date = publication_date
+        self.scraped_at = scraped_at
+        self.spider_name = spider_name
+
+    def __getitem__(self, field_name: str) -> Any:
+        """Return a field value by name, dict-style."""
+        if field_name not in _FIELD_SET:
+            raise KeyError(f"ArticleItem does not support field: {field_name}")
+        return getattr(self, field_name)
+
+    def __setitem__(self, field_name: str, value: Any) -> None:
+        """Set a field value by name, dict-style."""
+        if field_name not in _FIELD_SET:
+            raise KeyError(f"ArticleItem does not support field: {field_name}")
+        setattr(self, field_name, value)
+
+    def __contains__(self, field_name: str) -> bool:
+        """Return True for any defined field name."""
+        return field_name in _FIELD_SET
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the field names."""
+        return iter(FIELDS)
+
+    def __len__(self) -> int:
+        """Return the number of defined fields."""
+        return len(FIELDS)
+
+    def get(self, field_name: str, default: Any = None) -> Any:
+        """Return a field value, or the default for unknown field names."""
+        if field_name not in _FIELD_SET:
+            return default
+        return getattr(self, field_name)
+
+    def __repr__(self) -> str:
+        """Return a debug representation showing all field values."""
+        field_reprs = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in FIELDS)
+        return f"ArticleItem({field_reprs})"
+
+
+class _ArticleItemAdapter(AdapterInterface):
+    """itemadapter bridge for the slotted ArticleItem.
+
+    Registering this adapter keeps ``itemadapter.is_item`` (used by
+    Scrapy's core and feed exporters) returning True for ArticleItem now
+    that it is no longer a ``scrapy.Item`` subclass.
+    """
+
+    @classmethod
+    def is_item_class(cls, item_class: type) -> bool:
+        """Return True for ArticleItem and subclasses."""
+        return issubclass(item_class, ArticleItem)
+
+    @classmethod
+    def get_field_names_from_class(cls, item_class: type) -> Optional[List[str]]:
+        """Return the declared field names."""
+        return list(item_class.__slots__)
+
+    def __getitem__(self, field_name: str) -> Any:
+        return self.item[field_name]
+
+    def __setitem__(self, field_name: str, value: Any) -> None:
+        self.item[field_name] = value
+
+    def __delitem__(self, field_name: str) -> None:
+        if field_name not in _FIELD_SET:
+            raise KeyError(field_name)
+        setattr(self.item, field_name, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIELDS)
+
+    def __len__(self) -> int:
+        return len(FIELDS)
+
+
+ItemAdapter.ADAPTER_CLASSES.appendleft(_ArticleItemAdapter)
@@ -1,220 +1,441 @@
 """Item processing pipelines for the Zerdisha Scrapers project.
 
-This module implements a series of small, single-responsibility pipelines
-that can be chained together for modular, maintainable data processing.
-Each pipeline focuses on a specific aspect of data validation and cleaning.
+This module implements the item processing stage for scraped articles.
+Validation, string cleaning, and timestamp standardization are fused into
+a single pipeline (ArticleProcessingPipeline) so each item is adapted and
+walked once instead of three times. The original single-responsibility
+pipeline classes are retained as thin wrappers for backward compatibility
+with existing configurations.
 
 See documentation:
 https://docs.scrapy.org/en/latest/topics/item-pipeline.html
 """
 
 import logging
+import sys
 import unicodedata
+from functools import lru_cache
 from datetime import datetime
 from typing import Any, Union
 
 import scrapy
-from itemadapter import ItemAdapter
-from scrapy.exceptions import DropItem
+from scrapy.exceptions import DropItem, NotConfigured
 
-from zerdisha_scrapers.items import ArticleItem
+from zerdisha_scrapers.items import FIELDS, ArticleItem
 
+# orjson serializes the flat item dicts written by the batch writer
+# several times faster than stdlib json; fall back to a bytes-producing
+# stdlib wrapper when it is not installed.
+try:
+    from orjson import dumps as _json_dumps
+except ImportError:  # pragma: no cover - exercised only without orjson
+    import json as _stdlib_json
 
-class ValidationPipeline:
-    """Pipeline for validating essential fields in ArticleItem instances.
-    
-    This pipeline ensures that all critical fields required for a valid
-    article are present and not empty. Missing or empty essential fields
-    will cause the item to be dropped with detailed logging.
-    
-    Essential fields validated:
-        - url: The canonical URL of the article
-        - title: The article's headline/title  
-        - full_text: Complete article content/body text
-        - source_name: Name of the news source/publication
+    def _json_dumps(obj: Any) -> bytes:
+        return _stdlib_json.dumps(obj).encode("utf-8")
+
+# ciso8601 parses ISO 8601 strings in C, roughly an order of magnitude
+# faster than datetime.fromisoformat and far faster than strptime; fall
+# back to fromisoformat when it is not installed.
+try:
+    import ciso8601
+except ImportError:  # pragma: no cover - exercised only without ciso8601
+    ciso8601 = None
+
+# datetime.fromisoformat only accepts the 'Z' suffix natively from Python
+# 3.11; pick the parser once at import time so pre-3.11 pays the suffix
+# check (and splice only when 'Z' is actually present) instead of an
+# unconditional str.replace allocation per call.
+if sys.version_info >= (3, 11):
+    _iso_parse = datetime.fromisoformat
+else:
+    def _iso_parse(timestamp: str) -> datetime:
+        if timestamp.endswith('Z'):
+            timestamp = timestamp[:-1] + '+00:00'
+        return datetime.fromisoformat(timestamp)
+
+
+# strptime format strings for the day/month date fallback, prebuilt for
+# every (separator, day-first) combination so the hot path does a dict
+# probe instead of assembling an f-string format per call.
+_DAY_MONTH_FORMATS = {
+    ('/', True): '%d/%m/%Y',
+    ('/', False): '%m/%d/%Y',
+    ('-', True): '%d-%m-%Y',
+    ('-', False): '%m-%d-%Y',
+}
+
+# Fields that must be present and non-empty for an item to be kept,
+# ordered most-likely-to-fail first (extraction misses hit full_text far
+# more often than url) so a doomed item is dropped as early as possible.
+_ESSENTIAL_FIELDS = ('full_text', 'title', 'url', 'source_name')
+
+# Fields standardized to ISO 8601 timestamp strings.
+TIMESTAMP_FIELDS = ('publication_date', 'scraped_at')
+
+
+def _standardize_timestamp(timestamp: Union[str, datetime]) -> str:
+    """Convert various timestamp formats to ISO 8601 string.
+
+    Args:
+        timestamp: The timestamp to standardize (string or datetime object).
+
+    Returns:
+        str: ISO 8601 formatted timestamp string.
+
+    Raises:
+        ValueError: If the timestamp cannot be parsed.
+    """
+    if isinstance(timestamp, datetime):
+        return timestamp.isoformat()
+
+    if isinstance(timestamp, str):
+        return _standardize_timestamp_str(timestamp)
+
+    raise ValueError(f"Unsupported timestamp type: {type(timestamp)}")
+
+
+@lru_cache(maxsize=512)
+def _standardize_timestamp_str(timestamp: str) -> str:
+    """Parse and standardize a timestamp string, memoizing the result.
+
+    Within one crawl, scraped_at usually repeats the spider start time
+    across every item, so after the first parse the repeats collapse to a
+    cache lookup. Unparseable strings raise and are never cached.
+
+    Args:
+        timestamp: The timestamp string to standardize.
+
+    Returns:
+        str: ISO 8601 formatted timestamp string.
+
+    Raises:
+        ValueError: If the timestamp cannot be parsed.
+    """
+    # ISO-like input (the overwhelmingly common case): a single C-level
+    # parse covers every ISO shape the old strptime list handled,
+    # including the 'Z' suffix and the space separator.
+    if ciso8601 is not None:
+        try:
+            return ciso8601.parse_datetime(timestamp).isoformat()
+        except ValueError:
+            pass
+    else:
+        try:
+            return _iso_parse(timestamp).isoformat()
+        except ValueError:
+            pass
+
+    # Shape dispatch for the remaining day-first/month-first formats
+    # (DD/MM/YYYY, MM/DD/YYYY and their dashed variants): the magnitude of
+    # the leading fields decides the format, so exactly one strptime runs.
+    if (len(timestamp) == 10 and timestamp[2] in '/-'
+            and timestamp[5] == timestamp[2]):
+        separator = timestamp[2]
+        try:
+            first = int(timestamp[:2])
+            second = int(timestamp[3:5])
+        except ValueError:
+            first = second = 0
+
+        if first or second:
+            # Day-first unless the second field can only be a day; for
+            # ambiguous values the old format list tried day-first too.
+            fmt = _DAY_MONTH_FORMATS[separator, second <= 12]
+            try:
+                return datetime.strptime(timestamp, fmt).isoformat()
+            except ValueError:
+                pass
+
+    raise ValueError(f"Unable to parse timestamp format: {timestamp}")
+
+
+class ArticleProcessingPipeline:
+    """Fused validation, cleaning, and timestamp pipeline for ArticleItem.
+
+    Performs in a single item pass what the ValidationPipeline,
+    CleaningPipeline, and TimestampPipeline previously did in sequence:
+
+    - Validates that all essential fields (url, title, full_text,
+      source_name) are present and non-empty, dropping the item otherwise.
+    - Strips whitespace from all string fields and normalizes them to
+      Unicode NFC form.
+    - Standardizes publication_date and scraped_at to ISO 8601 strings,
+      preserving the original value when parsing fails.
+
+    Fusing the stages constructs one ItemAdapter, walks the fields once,
+    and emits one debug log per item instead of three of each.
     """
-    
+
     def process_item(self, item: ArticleItem, spider: scrapy.Spider) -> ArticleItem:
-        """Validate essential fields in the article item.
-        
+        """Validate, clean, and standardize the article item in one pass.
+
         Args:
-            item: The ArticleItem to validate.
+            item: The ArticleItem to process.
             spider: The spider that produced this item.
-            
+
         Returns:
-            ArticleItem: The validated item if all essential fields are present.
-            
+            ArticleItem: The processed item.
+
         Raises:
             DropItem: If any essential field is missing or empty.
         """
-        adapter = ItemAdapter(item)
-        
-        # Define essential fields that must be present and non-empty
-        essential_fields = ['url', 'title', 'full_text', 'source_name']
-        
-        for field_name in essential_fields:
-            field_value = adapter.get(field_name)
-            
-            if field_value is None:
-                error_msg = f"Missing essential field '{field_name}' in item from {spider.name}"
-                spider.logger.warning(error_msg)
-                raise DropItem(error_msg)
-            
-            if isinstance(field_value, str) and not field_value.strip():
-                error_msg = f"Empty essential field '{field_name}' in item from {spider.name}"
-                spider.logger.warning(error_msg)
+        # ArticleItem is a slotted class, so every field read/write below
+        # is a C-level slot lookup with no dict probe or adapter dispatch.
+        for field_name in _ESSENTIAL_FIELDS:
+            field_value = getattr(item, field_name)
+
+            # One fused branch: falsy covers both unset (None) and empty
+            # string, and str.isspace is a C-level scan that stops at the
+            # first non-whitespace character without allocating a copy.
+            if not field_value or (type(field_value) is str
+                                   and field_value.isspace()):
+                error_msg = (f"Missing or empty essential field "
+                             f"'{field_name}' in item from {spider.name}")
+                if spider.logger.isEnabledFor(logging.WARNING):
+                    spider.logger.warning(error_msg)
                 raise DropItem(error_msg)
-        
-        spider.logger.debug(f"Item validation passed for: {adapter.get('title', 'Unknown')[:50]}...")
+
+        # Pre-bind hot lookups so the loop below does LOAD_FAST instead of
+        # a module attribute resolution per field.
+        is_normalized = unicodedata.is_normalized
+        normalize = unicodedata.normalize
+        timestamp_fields = TIMESTAMP_FIELDS
+
+        # Single walk over the populated fields: clean strings in place and
+        # standardize the timestamp fields as they come past.
+        for field_name in FIELDS:
+            field_value = getattr(item, field_name)
+
+            if isinstance(field_value, str):
+                field_value = field_value.strip()
+                # normalize() allocates a new string even when nothing
+                # changes; skip it for ASCII (always NFC) and for strings
+                # the C-level quick check already knows are normalized.
+                if (not field_value.isascii()
+                        and not is_normalized('NFC', field_value)):
+                    field_value = normalize('NFC', field_value)
+                setattr(item, field_name, field_value)
+
+            if field_name in timestamp_fields and field_value is not None:
+                try:
+                    setattr(item, field_name, _standardize_timestamp(field_value))
+                except ValueError as e:
+                    spider.logger.warning(
+                        "Failed to parse %s '%s': %s", field_name, field_value, e)
+                    # Keep the original value if parsing fails
+
+        # Lazy %-formatting: the %.50s truncation and interpolation only
+        # run if a handler actually wants DEBUG records
+        spider.logger.debug(
+            "Item processing completed for: %.50s...", item.title or 'Unknown')
         return item
 
 
-class CleaningPipeline:
-    """Pipeline for cleaning and normalizing string fields in ArticleItem instances.
-    
-    This pipeline performs basic string cleaning operations on all string fields:
-    - Strips leading and trailing whitespace
-    - Normalizes Unicode to NFC (Normalization Form Composed) for consistency
-    
-    This ensures consistent string formatting across all articles regardless
-    of the source's original formatting or encoding issues.
+class BatchedJsonWriterPipeline:
+    """Buffered JSON-lines writer that amortizes output I/O across items.
+
+    Writing each item as it arrives costs one serialization plus one file
+    write (and its syscall) per article. This pipeline buffers serialized
+    lines and flushes them in a single write per batch, cutting the write
+    count by the batch factor while leaving the spiders' per-item yield
+    pattern untouched; remnants are flushed when the spider closes.
+
+    The pipeline is registered after ArticleProcessingPipeline but stays
+    dormant (NotConfigured) unless the BATCH_WRITER_PATH setting names an
+    output file, so deployments relying on Scrapy's feed exports are
+    unaffected.
     """
-    
+
+    def __init__(self, path: str, batch_size: int = 128) -> None:
+        """Set up the writer for the given output path.
+
+        Args:
+            path: Path of the JSON-lines file to append items to.
+            batch_size: Number of items buffered between flushes.
+        """
+        self._path = path
+        self._batch_size = batch_size
+        self._buffer: list = []
+        self._file: Any = None
+
+    @classmethod
+    def from_crawler(cls, crawler: Any) -> 'BatchedJsonWriterPipeline':
+        """Build the pipeline from crawler settings.
+
+        Args:
+            crawler: The crawler whose settings configure the writer.
+
+        Returns:
+            BatchedJsonWriterPipeline: The configured pipeline.
+
+        Raises:
+            NotConfigured: If BATCH_WRITER_PATH is not set, disabling the
+                pipeline for this crawl.
+        """
+        path = crawler.settings.get('BATCH_WRITER_PATH')
+        if not path:
+            raise NotConfigured("BATCH_WRITER_PATH is not set")
+
+        return cls(
+            path, crawler.settings.getint('BATCH_WRITER_BATCH_SIZE', 128))
+
+    def open_spider(self, spider: scrapy.Spider) -> None:
+        """Open the output file for appending.
+
+        Args:
+            spider: The spider that was opened.
+        """
+        self._file = open(self._path, 'ab')
+
     def process_item(self, item: ArticleItem, spider: scrapy.Spider) -> ArticleItem:
-        """Clean and normalize all string fields in the article item.
-        
+        """Buffer the serialized item, flushing once per full batch.
+
         Args:
-            item: The ArticleItem to clean.
+            item: The ArticleItem to write.
             spider: The spider that produced this item.
-            
+
         Returns:
-            ArticleItem: The item with cleaned string fields.
+            ArticleItem: The unmodified item, for downstream pipelines.
         """
-        adapter = ItemAdapter(item)
-        
-        # Process all fields that contain string data
-        for field_name, field_value in adapter.items():
-            if isinstance(field_value, str):
-                # Strip whitespace and normalize Unicode
-                cleaned_value = field_value.strip()
-                cleaned_value = unicodedata.normalize('NFC', cleaned_value)
-                adapter[field_name] = cleaned_value
-        
-        spider.logger.debug(f"String cleaning completed for: {adapter.get('title', 'Unknown')[:50]}...")
+        self._buffer.append(
+            _json_dumps({name: getattr(item, name) for name in FIELDS}))
+
+        if len(self._buffer) >= self._batch_size:
+            self._flush()
+
         return item
 
+    def close_spider(self, spider: scrapy.Spider) -> None:
+        """Flush any buffered remnants and close the output file.
+
+        Args:
+            spider: The spider that was closed.
+        """
+        self._flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _flush(self) -> None:
+        """Write the buffered lines in one call and clear the buffer."""
+        if not self._buffer:
+            return
+
+        self._buffer.append(b'')  # trailing newline for the final line
+        self._file.write(b'\n'.join(self._buffer))
+        self._file.flush()
+        self._buffer.clear()
+
+
+class ValidationPipeline:
+    """Backward-compatible wrapper around ArticleProcessingPipeline.
+
+    Kept so existing configurations referencing the original
+    single-responsibility pipeline keep working; new deployments should
+    reference ArticleProcessingPipeline directly.
+    """
+
+    def __init__(self) -> None:
+        """Set up the fused pipeline handling the actual processing."""
+        self._fused = ArticleProcessingPipeline()
+
+    def process_item(self, item: ArticleItem, spider: scrapy.Spider) -> ArticleItem:
+        """Process the item through the fused pipeline.
+
+        Args:
+            item: The ArticleItem to process.
+            spider: The spider that produced this item.
+
+        Returns:
+            ArticleItem: The processed item.
+
+        Raises:
+            DropItem: If any essential field is missing or empty.
+        """
+        return self._fused.process_item(item, spider)
+
+
+class CleaningPipeline:
+    """Backward-compatible wrapper around ArticleProcessingPipeline.
+
+    Kept so existing configurations referencing the original
+    single-responsibility pipeline keep working; new deployments should
+    reference ArticleProcessingPipeline directly.
+    """
+
+    def __init__(self) -> None:
+        """Set up the fused pipeline handling the actual processing."""
+        self._fused = ArticleProcessingPipeline()
+
+    def process_item(self, item: ArticleItem, spider: scrapy.Spider) -> ArticleItem:
+        """Process the item through the fused pipeline.
+
+        Args:
+            item: The ArticleItem to process.
+            spider: The spider that produced this item.
+
+        Returns:
+            ArticleItem: The processed item.
+        """
+        return self._fused.process_item(item, spider)
+
 
 class TimestampPipeline:
-    """Pipeline for handling and standardizing timestamp fields in ArticleItem instances.
-    
-    This pipeline ensures that date/time fields are properly formatted as
-    ISO 8601 strings. It handles various input formats and gracefully
-    converts them to the standardized format.
-    
-    Fields processed:
-        - publication_date: When the article was originally published
-        - scraped_at: When this article was scraped by our system
+    """Backward-compatible wrapper around ArticleProcessingPipeline.
+
+    Kept so existing configurations referencing the original
+    single-responsibility pipeline keep working; new deployments should
+    reference ArticleProcessingPipeline directly.
     """
-    
+
+    def __init__(self) -> None:
+        """Set up the fused pipeline handling the actual processing."""
+        self._fused = ArticleProcessingPipeline()
+
     def process_item(self, item: ArticleItem, spider: scrapy.Spider) -> ArticleItem:
-        """Standardize timestamp fields to ISO 8601 format.
-        
+        """Process the item through the fused pipeline.
+
         Args:
             item: The ArticleItem to process.
             spider: The spider that produced this item.
-            
+
         Returns:
-            ArticleItem: The item with standardized timestamp fields.
+            ArticleItem: The processed item.
         """
-        adapter = ItemAdapter(item)
-        
-        # Process publication_date (optional field)
-        publication_date = adapter.get('publication_date')
-        if publication_date is not None:
-            try:
-                standardized_date = self._standardize_timestamp(publication_date)
-                adapter['publication_date'] = standardized_date
-            except ValueError as e:
-                spider.logger.warning(f"Failed to parse publication_date '{publication_date}': {e}")
-                # Keep the original value if parsing fails
-        
-        # Process scraped_at (required field)
-        scraped_at = adapter.get('scraped_at')
-        if scraped_at is not None:
-            try:
-                standardized_date = self._standardize_timestamp(scraped_at)
-                adapter['scraped_at'] = standardized_date
-            except ValueError as e:
-                spider.logger.warning(f"Failed to parse scraped_at '{scraped_at}': {e}")
-                # Keep the original value if parsing fails
-        
-        spider.logger.debug(f"Timestamp processing completed for: {adapter.get('title', 'Unknown')[:50]}...")
-        return item
-    
+        return self._fused.process_item(item, spider)
+
     def _standardize_timestamp(self, timestamp: Union[str, datetime]) -> str:
         """Convert various timestamp formats to ISO 8601 string.
-        
+
         Args:
             timestamp: The timestamp to standardize (string or datetime object).
-            
+
         Returns:
             str: ISO 8601 formatted timestamp string.
-            
+
         Raises:
             ValueError: If the timestamp cannot be parsed.
         """
-        if isinstance(timestamp, datetime):
-            return timestamp.isoformat()
-        
-        if isinstance(timestamp, str):
-            # If already in ISO format, validate and return
-            try:
-                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                return dt.isoformat()
-            except ValueError:
-                pass
-            
-            # Try common date formats
-            common_formats = [
-                '%Y-%m-%d %H:%M:%S',
-                '%Y-%m-%d %H:%M:%S.%f',
-                '%Y-%m-%dT%H:%M:%S',
-                '%Y-%m-%dT%H:%M:%S.%f',
-                '%Y-%m-%d',
-                '%d/%m/%Y',
-                '%m/%d/%Y',
-                '%d-%m-%Y',
-                '%m-%d-%Y',
-            ]
-            
-            for fmt in common_formats:
-                try:
-                    dt = datetime.strptime(timestamp, fmt)
-                    return dt.isoformat()
-                except ValueError:
-                    continue
-            
-            raise ValueError(f"Unable to parse timestamp format: {timestamp}")
-        
-        raise ValueError(f"Unsupported timestamp type: {type(timestamp)}")
+        return _standardize_timestamp(timestamp)
 
 
 # Legacy pipeline for backward compatibility
 class ZerdishaScrapersPipeline:
     """Legacy pipeline for backward compatibility.
-    
+
     This pipeline is kept for compatibility with existing configurations
-    but should be replaced with the specific validation, cleaning, and
-    timestamp pipelines for new deployments.
+    but should be replaced with the ArticleProcessingPipeline for new
+    deployments.
     """
-    
+
     def process_item(self, item: ArticleItem, spider: scrapy.Spider) -> ArticleItem:
         """Process item with basic passthrough functionality.
-        
+
         Args:
             item: The item to process.
             spider: The spider that produced this item.
-            
+
         Returns:
             ArticleItem: The unmodified item.
         """
@@ -0,0 +1,359 @@
+"""Streaming RSS feed parsing helpers for the Zerdisha Scrapers project.
+
+This module replaces the previous ``feedparser.parse(url)`` call sites in the
+spiders with a streaming ``lxml.etree.iterparse`` based reader. feedparser
+builds a full data-dict for every entry (including expensive date parsing and
+HTML sanitization), which dominates RSS ingest time for large feeds. The
+spiders only need ``link``, ``title`` and ``pubDate`` per entry, so parsing
+just those fields from a streamed response is both significantly faster and
+keeps peak memory bounded to a single ``<item>`` element.
+
+Publication dates are parsed with ``dateutil.parser`` using an explicit
+timezone abbreviation map, avoiding heavyweight natural-language date parsing.
+"""
+
+import io
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
+
+from dateutil import parser as date_parser
+from lxml import etree
+
+from zerdisha_scrapers import http
+
+logger = logging.getLogger(__name__)
+
+# orjson encodes/decodes small dicts several times faster than stdlib json;
+# fall back to the stdlib (normalized to a bytes interface) when it is not
+# installed so the state files stay interchangeable either way.
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:  # pragma: no cover - exercised only without orjson
+    import json as _stdlib_json
+
+    def _json_dumps(obj: Any) -> bytes:
+        return _stdlib_json.dumps(obj).encode("utf-8")
+
+    _json_loads = _stdlib_json.loads
+
+# Timezone abbreviations commonly seen in RSS <pubDate> values, mapped to
+# their UTC offsets in seconds for dateutil's tzinfos support.
+TZMAP: Dict[str, int] = {
+    "UT": 0,
+    "GMT": 0,
+    "UTC": 0,
+    "EST": -5 * 3600,
+    "EDT": -4 * 3600,
+    "CST": -6 * 3600,
+    "CDT": -5 * 3600,
+    "MST": -7 * 3600,
+    "MDT": -6 * 3600,
+    "PST": -8 * 3600,
+    "PDT": -7 * 3600,
+    # Nepal Time, the native timezone for the sources we scrape.
+    "NPT": 5 * 3600 + 45 * 60,
+}
+
+
+#: Default directory for persisted per-feed HTTP validator state.
+DEFAULT_STATE_DIR = Path(".cache/feedstate")
+
+
+class _FeedState:
+    """Persisted ETag / Last-Modified validators for a single feed.
+
+    Feeds rarely change between polls, so re-downloading and re-parsing the
+    full XML on every run is wasted work. This class stores the validators
+    the server returned for the last successful fetch in a small JSON file,
+    so the next fetch can make a conditional GET and skip both transfer and
+    parsing when the server answers 304 Not Modified.
+
+    Attributes:
+        etag: The ETag header from the last successful fetch, if any.
+        modified: The Last-Modified header from the last fetch, if any.
+    """
+
+    def __init__(self, key: str, state_dir: Union[str, Path] = DEFAULT_STATE_DIR) -> None:
+        """Load any previously persisted state for the given feed key.
+
+        Args:
+            key: A stable identifier for the feed (typically the spider name).
+            state_dir: Directory holding the per-feed state files.
+        """
+        self._path: Path = Path(state_dir) / f"{key}.json"
+
+        try:
+            data = _json_loads(self._path.read_bytes())
+        except (OSError, ValueError):
+            data = {}
+
+        self.etag: Optional[str] = data.get("etag")
+        self.modified: Optional[str] = data.get("modified")
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Build conditional request headers from the stored validators.
+
+        Returns:
+            A headers dict with If-None-Match / If-Modified-Since entries
+            for whichever validators are known; empty on first fetch.
+        """
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.modified:
+            headers["If-Modified-Since"] = self.modified
+        return headers
+
+    def update(self, response: Any) -> None:
+        """Persist the validators from a successful (200) feed response.
+
+        Args:
+            response: The HTTP response whose ETag / Last-Modified headers
+                should become the validators for the next poll.
+        """
+        etag: Optional[str] = response.headers.get("ETag")
+        modified: Optional[str] = response.headers.get("Last-Modified")
+
+        if etag == self.etag and modified == self.modified:
+            return
+
+        self.etag = etag
+        self.modified = modified
+
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._path.write_bytes(
+                _json_dumps({"etag": etag, "modified": modified}))
+        except OSError as e:
+            logger.warning(f"Could not persist feed state to {self._path}: {str(e)}")
+
+
+def load_seen_guids(
+    key: str,
+    state_dir: Union[str, Path] = DEFAULT_STATE_DIR,
+) -> set:
+    """Load the persisted set of already-dispatched entry GUIDs for a feed.
+
+    Args:
+        key: A stable identifier for the feed (typically the spider name).
+        state_dir: Directory holding the per-feed state files.
+
+    Returns:
+        The set of GUIDs (entry links) seen on previous polls; empty when
+        no state has been persisted yet.
+    """
+    path = Path(state_dir) / f"{key}_seen.json"
+    try:
+        return set(_json_loads(path.read_bytes()))
+    except (OSError, ValueError):
+        return set()
+
+
+def save_seen_guids(
+    key: str,
+    guids: set,
+    state_dir: Union[str, Path] = DEFAULT_STATE_DIR,
+) -> None:
+    """Persist the set of dispatched entry GUIDs for the next poll.
+
+    Args:
+        key: A stable identifier for the feed (typically the spider name).
+        guids: The GUIDs (entry links) dispatched so far.
+        state_dir: Directory holding the per-feed state files.
+    """
+    path = Path(state_dir) / f"{key}_seen.json"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(_json_dumps(sorted(guids)))
+    except OSError as e:
+        logger.warning(f"Could not persist seen GUIDs to {path}: {str(e)}")
+
+
+#: Feed bodies fetched ahead of time by prefetch_feeds, keyed by URL.
+#: Entries are consumed (removed) by the next iter_entries call for that
+#: URL, so a prefetch serves exactly one parse.
+_PREFETCH_CACHE: Dict[str, bytes] = {}
+
+
+def prefetch_feeds(
+    urls: Iterable[str],
+    timeout: int = 10,
+    max_workers: int = 4,
+) -> Dict[str, bytes]:
+    """Fetch several RSS feeds concurrently and cache their bodies.
+
+    Feed fetching is network-bound, so downloading the feeds for multiple
+    spiders on a small thread pool overlaps the request latencies instead
+    of paying them serially. Fetched bodies are stored in a module-level
+    cache that iter_entries consults before going to the network, so
+    spiders need no changes to benefit.
+
+    Args:
+        urls: The RSS feed URLs to fetch.
+        timeout: HTTP timeout in seconds per feed request.
+        max_workers: Maximum number of concurrent fetch threads.
+
+    Returns:
+        A dict mapping each successfully fetched URL to its body bytes.
+        Failed fetches are logged and omitted; the affected spider will
+        fall back to fetching its feed directly.
+    """
+    def _fetch(feed_url: str) -> bytes:
+        response = http.SESSION.get(feed_url, timeout=timeout)
+        response.raise_for_status()
+        return response.content
+
+    fetched: Dict[str, bytes] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(_fetch, feed_url): feed_url for feed_url in urls}
+
+        for future in as_completed(futures):
+            feed_url = futures[future]
+            try:
+                fetched[feed_url] = future.result()
+            except Exception as e:
+                logger.warning(
+                    f"Prefetch failed for feed {feed_url}: {str(e)}")
+
+    _PREFETCH_CACHE.update(fetched)
+    return fetched
+
+
+def parse_pubdate(pubdate: Optional[str]) -> Optional[datetime]:
+    """Parse an RSS ``pubDate`` string into a datetime object.
+
+    Uses ``dateutil.parser`` with an explicit timezone abbreviation map,
+    which is much cheaper than feedparser's generic date handling.
+
+    Args:
+        pubdate: The raw ``pubDate`` text from an RSS entry, or None.
+
+    Returns:
+        A (possibly timezone-aware) datetime, or None if parsing fails.
+    """
+    if not pubdate:
+        return None
+
+    try:
+        return date_parser.parse(pubdate, tzinfos=TZMAP)
+    except (ValueError, OverflowError) as e:
+        logger.debug(f"Could not parse pubDate '{pubdate}': {str(e)}")
+        return None
+
+
+def iter_entries(
+    url: str,
+    timeout: int = 10,
+    state_key: Optional[str] = None,
+    state_dir: Union[str, Path] = DEFAULT_STATE_DIR,
+    max_entries: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Stream and parse an RSS feed, yielding one entry dict per ``<item>``.
+
+    The feed is fetched with a streaming HTTP request and parsed
+    incrementally with ``lxml.etree.iterparse``, so only one ``<item>``
+    element is held in memory at a time. Each processed element is cleared
+    and its preceding siblings deleted to keep memory usage flat for
+    arbitrarily large feeds.
+
+    If the feed body was already downloaded by :func:`prefetch_feeds`, the
+    cached bytes are parsed directly and no network request is made.
+
+    When ``state_key`` is given, the fetch is a conditional GET using the
+    ETag / Last-Modified validators persisted from the previous poll; a
+    304 Not Modified response yields no entries and skips parsing entirely.
+
+    Args:
+        url: The RSS feed URL to fetch and parse.
+        timeout: HTTP timeout in seconds for the feed request.
+        state_key: Stable feed identifier enabling conditional GET state
+            (typically the spider name); None disables conditional fetching.
+        state_dir: Directory for the persisted per-feed state files.
+        max_entries: Maximum number of entries to yield; parsing stops
+            early once reached. None yields the whole feed.
+
+    Yields:
+        Dicts with the keys ``link``, ``title``, ``published`` (the raw
+        ``pubDate`` string) and ``published_parsed`` (a datetime or None).
+    """
+    prefetched: Optional[bytes] = _PREFETCH_CACHE.pop(url, None)
+    if prefetched is not None:
+        source = io.BytesIO(prefetched)
+    else:
+        state: Optional[_FeedState] = None
+        headers: Optional[Dict[str, str]] = None
+        if state_key:
+            state = _FeedState(state_key, state_dir)
+            headers = state.conditional_headers()
+
+        response = http.SESSION.get(
+            url, stream=True, timeout=timeout, headers=headers)
+
+        if state is not None and response.status_code == 304:
+            logger.debug(f"Feed not modified since last poll, skipping: {url}")
+            return
+
+        response.raise_for_status()
+
+        if state is not None:
+            state.update(response)
+
+        # Let urllib3 transparently decode gzip/deflate so iterparse sees XML.
+        response.raw.decode_content = True
+        source = response.raw
+
+    yield from parse_rss2(source, max_entries=max_entries)
+
+
+def parse_rss2(
+    source: Any,
+    max_entries: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Parse RSS 2.0 bytes or a file-like object into entry dicts.
+
+    All the feeds this project polls are known to be RSS 2.0, so there is
+    no need for generic feed-type dispatch or per-entry HTML sanitization;
+    this goes straight to the ``<item>`` elements and reads only the
+    fields the spiders use.
+
+    Because parsing is streamed, ``max_entries`` is a genuine early abort:
+    the tail of the feed past the cap is never parsed at all.
+
+    Args:
+        source: The feed XML as bytes, or a file-like object yielding it.
+        max_entries: Maximum number of entries to yield; parsing stops
+            early once reached. None yields the whole feed.
+
+    Yields:
+        Dicts with the keys ``link``, ``title``, ``published`` (the raw
+        ``pubDate`` string) and ``published_parsed`` (a datetime or None).
+    """
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+
+    count = 0
+    for _, elem in etree.iterparse(source, events=("end",), tag="item"):
+        published: Optional[str] = elem.findtext("pubDate")
+
+        yield {
+            "link": elem.findtext("link"),
+            "title": elem.findtext("title"),
+            "published": published,
+            "published_parsed": parse_pubdate(published),
+        }
+
+        # Free the processed element and any already-yielded siblings to
+        # bound memory while streaming through large feeds.
+        elem.clear()
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+
+        count += 1
+        if max_entries is not None and count >= max_entries:
+            return
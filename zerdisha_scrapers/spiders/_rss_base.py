@@ -0,0 +1,245 @@
+"""Shared base class for the hybrid RSS/Scrapy news spiders.
+
+The per-site spiders all follow the same shape: stream the site's RSS
+feed for discovery, request each linked article page, and extract the
+body, title, and author with site-specific selectors. This module
+factors that shared control flow into :class:`RSSHybridSpider` so each
+site declares only its constants (feed URL, source name, selectors) and
+its publication-date strategy, instead of duplicating ``start_requests``
+and ``parse_article`` wholesale.
+
+The shared ``parse_article`` reads the per-site constants into locals
+once per call, so the hot extraction path runs on LOAD_FAST locals
+rather than repeated class-attribute lookups.
+"""
+
+import re
+from datetime import datetime, timezone
+from typing import Any, Generator, List, Optional
+
+import scrapy
+from scrapy.http import Request, Response
+
+from zerdisha_scrapers import csscache, fastparse, rss
+from zerdisha_scrapers.items import ArticleItem
+
+# timezone.utc bound once at import; avoids re-resolving the attribute
+# chain on every timestamp.
+_UTC = timezone.utc
+
+# Collapses whitespace runs around paragraph boundaries in one C-level
+# regex pass over the joined text.
+_WS_RE = re.compile(r'\s*\n\s*\n\s*')
+
+
+class RSSHybridSpider(scrapy.Spider):
+    """Base class for hybrid RSS-discovery / full-content news spiders.
+
+    Subclasses declare the per-site constants below and implement
+    :meth:`_extract_publication_date`; discovery and article extraction
+    are handled here.
+
+    Attributes:
+        name: Unique identifier for the spider (subclass).
+        allowed_domains: Domains the spider may crawl (subclass).
+        rss_url: The RSS feed URL for article discovery (subclass).
+        source_name: Human-readable publication name for items (subclass).
+        content_css: CSS selector for body paragraphs, used by the
+            selectolax fast path (subclass).
+        content_xpath: Precompiled ``etree.XPath`` fallback matching the
+            body paragraph text nodes (subclass).
+        title_css: CSS selector for the page title fallback (subclass).
+        author_css: CSS selector(s) for the author byline (subclass).
+        max_entries: Cap on RSS entries consumed per poll; the streamed
+            parse aborts before touching the tail of the feed once this
+            many are yielded.
+    """
+
+    rss_url: str
+    source_name: str
+    content_css: str
+    content_xpath: Any
+    title_css: str
+    author_css: str
+    max_entries: int = 50
+
+    # Articles are effectively immutable once published, so cached pages
+    # can be served for a full day before revalidation.
+    custom_settings = {
+        'HTTPCACHE_EXPIRATION_SECS': 86400,
+    }
+
+    def start_requests(self) -> Generator[Request, None, None]:
+        """Generate initial requests by parsing the RSS feed.
+
+        This method fetches and parses the site's RSS feed to discover
+        new articles. For each article found in the feed, it creates a
+        request to the full article page with metadata preserved.
+
+        Yields:
+            Request: Scrapy requests for individual article pages with
+                    RSS metadata passed via the meta parameter.
+        """
+        self.logger.info(
+            "Starting %s spider with RSS feed: %s", self.name, self.rss_url)
+
+        try:
+            # Stream the RSS feed, parsing one entry at a time
+            self.logger.debug("Fetching RSS feed from: %s", self.rss_url)
+
+            # One timestamp per batch; every request shares the reference
+            start_time: datetime = datetime.now(_UTC)
+
+            # Build the whole batch in one list-comprehension pass (the
+            # feed is already capped at max_entries, so the list stays
+            # small); entries without a link are skipped by the condition
+            requests = [
+                scrapy.Request(
+                    url=entry['link'],
+                    callback=self.parse_article,
+                    meta={
+                        # Stripped once here so no downstream consumer
+                        # needs to re-strip the title
+                        'rss_title': (entry.get('title') or '').strip(),
+                        'spider_start_time': start_time
+                    }
+                )
+                for entry in rss.iter_entries(
+                    self.rss_url,
+                    state_key=self.name,
+                    max_entries=self.max_entries,
+                )
+                if entry.get('link')
+            ]
+            yield from requests
+
+        except Exception as e:
+            self.logger.error(
+                "Error processing RSS feed %s: %s", self.rss_url, e)
+
+    def parse_article(self, response: Response) -> Generator[ArticleItem, None, None]:
+        """Parse individual article pages and extract full content.
+
+        This method extracts the complete article content from individual
+        article pages using the subclass's selectors. It combines the
+        content with metadata from the RSS feed to create a complete
+        ArticleItem.
+
+        Args:
+            response: The HTTP response object for an individual article page.
+
+        Yields:
+            ArticleItem: Populated article item with extracted data and
+                        RSS metadata.
+        """
+        self.logger.debug("Parsing article page: %s", response.url)
+
+        try:
+            # Read the per-site constants into locals once for the call
+            content_css: str = self.content_css
+
+            # Extract full article content via the selectolax fast path,
+            # falling back to the precompiled XPath when unavailable
+            paragraphs: List[str] = fastparse.extract_paragraphs(
+                response.body, content_css)
+            if not paragraphs:
+                # text_content() concatenates all descendant text of a
+                # paragraph in one libxml2 C walk, so inline markup
+                # (<em>, <a>) neither fragments a paragraph into several
+                # text nodes nor loses its text.
+                paragraphs = [p.text_content()
+                              for p in self.content_xpath(response.selector.root)]
+
+            if not paragraphs:
+                self.logger.warning(
+                    "No content found using selector '%s' for %s",
+                    content_css, response.url)
+                return
+
+            # Join all paragraphs into full text
+            # Join once, then collapse the whitespace runs around the
+            # paragraph boundaries in a single regex pass and strip the ends
+            full_text: str = _WS_RE.sub(
+                '\n\n', '\n\n'.join(paragraphs)).strip()
+
+            if not full_text:
+                self.logger.warning(
+                    "No meaningful content extracted from %s", response.url)
+                return
+
+            # Get metadata from RSS feed (passed via meta)
+            rss_title: str = response.meta.get('rss_title', '')
+
+            # Use RSS title if available, otherwise try to extract from page
+            title: str = rss_title
+            if not title:
+                page_title: Optional[str] = csscache.css(
+                    response, self.title_css).get()
+                title = page_title.strip() if page_title else ''
+
+            if not title:
+                self.logger.warning("No title found for %s", response.url)
+                return
+
+            # Extract author if available (optional field)
+            author: Optional[str] = csscache.css(
+                response, self.author_css).get()
+            if author:
+                author = author.strip()
+
+            # Extract publication date from the article page
+            publication_date: Optional[str] = self._extract_publication_date(
+                response)
+
+            # Create timezone-aware timestamps in ISO 8601 format
+            scraped_at: str = datetime.now(_UTC).isoformat()
+
+            # Populate the ArticleItem in one constructor call: every
+            # field lands via a positional-default kwarg instead of eight
+            # separate validated __setitem__ calls.
+            article: ArticleItem = ArticleItem(
+                url=str(response.url),
+                source_name=self.source_name,
+                title=title,
+                full_text=full_text,
+                author=author,
+                publication_date=publication_date,
+                scraped_at=scraped_at,
+                spider_name=self.name,
+            )
+
+            self.logger.info(
+                "Successfully extracted article: %.50s...", title)
+
+            yield article
+
+        except Exception as e:
+            self.logger.error(
+                "Error parsing article %s: %s", response.url, e)
+
+    def _extract_publication_date(self, response: Response) -> Optional[str]:
+        """Extract the publication date from an article page.
+
+        The sites expose publication dates through different channels
+        (meta tags, time elements, URL structure), so each subclass
+        implements its own extraction strategy.
+
+        Args:
+            response: The HTTP response object for an individual article page.
+
+        Returns:
+            The publication date in ISO 8601 format, or None if not found.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} must implement _extract_publication_date")
+
+    def closed(self, reason: str) -> None:
+        """Called when the spider closes.
+
+        This method is called when the spider finishes crawling.
+        It provides final logging and cleanup operations.
+
+        Args:
+            reason: The reason why the spider was closed.
+        """
+        self.logger.info("Spider %s closed. Reason: %s", self.name, reason)
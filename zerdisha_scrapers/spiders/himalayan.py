@@ -5,38 +5,73 @@ discovery with full article content extraction. It uses The Himalayan Times'
 RSS feed for efficient article discovery and then fetches complete article
 content from individual pages using Scrapy.
 
-The spider demonstrates:
-- RSS feed parsing using feedparser
-- Hybrid approach: RSS for discovery, Scrapy for content extraction
-- Proper use of type hints, logging, and error handling
-- ArticleItem data contract compliance
-- Timezone-aware datetime handling with ISO 8601 serialization
+Discovery and article extraction are shared with the other news spiders
+through :class:`~zerdisha_scrapers.spiders._rss_base.RSSHybridSpider`;
+this module declares only the site constants and the site's
+publication-date extraction strategy.
 """
 
 import re
-from datetime import datetime, timezone
-from typing import Any, Generator, List, Optional
-
-import feedparser
-import scrapy
-from scrapy.http import Request, Response
-
-from zerdisha_scrapers.items import ArticleItem
-
-
-class HimalayanSpider(scrapy.Spider):
+import sys
+from datetime import datetime
+from typing import List, Optional
+
+from lxml import etree
+from scrapy.http import Response
+
+# rss is re-imported here (the base class drives the feed fetch) so the
+# module keeps a stable patch point for tests.
+from zerdisha_scrapers import csscache, rss
+from zerdisha_scrapers.spiders._rss_base import RSSHybridSpider
+
+# Interned once so every item shares the same immutable string objects
+# instead of allocating fresh copies per article.
+_SPIDER_NAME = sys.intern("himalayan")
+_SOURCE_NAME = sys.intern("The Himalayan Times")
+
+# ciso8601 parses ISO 8601 strings (including the 'Z' suffix) in C,
+# skipping both the stdlib parser and the per-call str.replace copy;
+# fall back to fromisoformat when it is not installed.
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # pragma: no cover - exercised only without ciso8601
+    def _parse_iso(value: str) -> datetime:
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value)
+
+# Precompiled XPath for the article body paragraphs. Compiling once at
+# import time skips the per-response CSS-to-XPath translation and XPath
+# compilation that response.css('.content-inner p') would otherwise
+# repeat; the base class reads each paragraph with text_content().
+_CONTENT_XPATH = etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '),"
+    " ' content-inner ')]//p"
+)
+
+# Precompiled "normalize-space(...)" XPath for the publication-date meta
+# tag: it returns the attribute text directly ('' when absent), already
+# whitespace-normalized, without building a SelectorList.
+_META_PUB = etree.XPath(
+    "normalize-space(//meta[@property='article:published_time']/@content)")
+
+# Same one-call form for the <time datetime="..."> attribute.
+_TIME_DT = etree.XPath("normalize-space(//time/@datetime)")
+
+# One anchored pass over the URL replaces the split()/isdigit() scanning
+# loop; the component ranges also validate the date, so no strptime
+# round-trip is needed on a match.
+_URL_DATE_RE = re.compile(
+    r'/(20\d{2})/(0[1-9]|1[0-2])/(0[1-9]|[12]\d|3[01])(?:/|$)')
+
+
+class HimalayanSpider(RSSHybridSpider):
     """Hybrid RSS/Scrapy spider for The Himalayan Times news articles.
 
     This spider uses The Himalayan Times' RSS feed to discover new articles
-    and then scrapes the full content from individual article pages. It
-    demonstrates the hybrid approach combining efficient RSS-based discovery
-    with comprehensive content extraction.
-
-    The spider follows all project coding standards including:
-    - Strict typing throughout all methods
-    - Comprehensive error handling and logging
-    - Proper ArticleItem instantiation and population
-    - Timezone-aware datetime handling
+    and then scrapes the full content from individual article pages. The
+    shared RSSHybridSpider base drives discovery and extraction; only the
+    site constants and date extraction live here.
 
     Attributes:
         name: Unique identifier for this spider.
@@ -44,147 +79,15 @@ class HimalayanSpider(scrapy.Spider):
         rss_url: The RSS feed URL for article discovery.
     """
 
-    name: str = "himalayan"
+    name: str = _SPIDER_NAME
     allowed_domains: List[str] = ["thehimalayantimes.com"]
     rss_url: str = "https://thehimalayantimes.com/feed"
 
-    def start_requests(self) -> Generator[Request, None, None]:
-        """Generate initial requests by parsing the RSS feed.
-
-        This method fetches and parses The Himalayan Times' RSS feed to
-        discover new articles. For each article found in the feed, it
-        creates a request to the full article page with metadata preserved.
-
-        Yields:
-            Request: Scrapy requests for individual article pages with
-                    RSS metadata passed via the meta parameter.
-        """
-        self.logger.info(
-            f"Starting {self.name} spider with RSS feed: {self.rss_url}")
-
-        try:
-            # Parse the RSS feed using feedparser
-            self.logger.debug(f"Fetching RSS feed from: {self.rss_url}")
-            feed = feedparser.parse(self.rss_url)
-
-            if feed.bozo:
-                self.logger.warning(
-                    f"RSS feed parsing had issues: {feed.bozo_exception}")
-
-            # Check if we got any entries
-            if not hasattr(feed, 'entries') or not feed.entries:
-                self.logger.error(
-                    f"No entries found in RSS feed: {self.rss_url}")
-                return
-
-            self.logger.info(f"Found {len(feed.entries)} articles in RSS feed")
-
-            # Create requests for each article in the feed
-            for entry in feed.entries:
-                if not hasattr(entry, 'link') or not entry.link:
-                    self.logger.warning("RSS entry missing link, skipping")
-                    continue
-
-                # Extract metadata from RSS entry
-                article_url: str = str(entry.link)
-                title: str = getattr(entry, 'title', '')
-
-                self.logger.debug(
-                    f"Creating request for article: {title[:50]}...")
-
-                # Yield request to the full article page
-                yield scrapy.Request(
-                    url=article_url,
-                    callback=self.parse_article,
-                    meta={
-                        'rss_title': title,
-                        'spider_start_time': datetime.now(timezone.utc)
-                    }
-                )
-
-        except Exception as e:
-            self.logger.error(
-                f"Error processing RSS feed {self.rss_url}: {str(e)}")
-
-    def parse_article(self, response: Response) -> Generator[ArticleItem, None, None]:
-        """Parse individual article pages and extract full content.
-
-        This method extracts the complete article content from individual
-        article pages using CSS selectors. It combines the content with
-        metadata from the RSS feed to create a complete ArticleItem.
-
-        Args:
-            response: The HTTP response object for an individual article page.
-
-        Yields:
-            ArticleItem: Populated article item with extracted data and
-                        RSS metadata.
-        """
-        self.logger.debug(f"Parsing article page: {response.url}")
-
-        try:
-            # Extract full article content using CSS selector
-            paragraphs: List[str] = response.css('.content-inner p::text').getall()
-
-            if not paragraphs:
-                self.logger.warning(
-                    f"No content found using CSS selector '.content-inner p' for {response.url}")
-                return
-
-            # Join all paragraphs into full text
-            full_text: str = '\n\n'.join(
-                paragraph.strip() for paragraph in paragraphs if paragraph.strip())
-
-            if not full_text:
-                self.logger.warning(
-                    f"No meaningful content extracted from {response.url}")
-                return
-
-            # Get metadata from RSS feed (passed via meta)
-            rss_title: str = response.meta.get('rss_title', '')
-
-            # Use RSS title if available, otherwise try to extract from page
-            title: str = rss_title
-            if not title:
-                page_title: Optional[str] = response.css('h1::text').get()
-                title = page_title.strip() if page_title else ''
-
-            if not title:
-                self.logger.warning(f"No title found for {response.url}")
-                return
-
-            # Extract author if available (optional field)
-            author: Optional[str] = response.css('.article-author::text').get()
-            if author:
-                author = author.strip()
-
-            # Extract publication date from the article page
-            publication_date: Optional[str] = self._extract_publication_date(
-                response)
-
-            # Create timezone-aware timestamps in ISO 8601 format
-            scraped_at: str = datetime.now(timezone.utc).isoformat()
-
-            # Create and populate the ArticleItem
-            article: ArticleItem = ArticleItem()
-
-            article['url'] = str(response.url)
-            article['source_name'] = "The Himalayan Times"
-            article['title'] = title.strip()
-            article['full_text'] = full_text
-            article['author'] = author
-            article['publication_date'] = publication_date
-            article['scraped_at'] = scraped_at
-            article['spider_name'] = self.name
-
-            self.logger.info(
-                f"Successfully extracted article: {title[:50]}...")
-
-            yield article
-
-        except Exception as e:
-            self.logger.error(
-                f"Error parsing article {response.url}: {str(e)}")
+    source_name: str = _SOURCE_NAME
+    content_css: str = 'div.content-inner p'
+    content_xpath = _CONTENT_XPATH
+    title_css: str = 'h1::text'
+    author_css: str = '.article-author::text'
 
     def _extract_publication_date(self, response: Response) -> Optional[str]:
         """Extract publication date from the article page.
@@ -201,72 +104,39 @@ class HimalayanSpider(scrapy.Spider):
         try:
             # Try to extract from meta tags or common date selectors
             # Check for meta property for publication date
-            pub_date_meta: Optional[str] = response.css(
-                'meta[property="article:published_time"]::attr(content)').get()
-            
+            pub_date_meta: str = _META_PUB(response.selector.root)
+
             if pub_date_meta:
                 try:
                     # Parse ISO format datetime and return date part
-                    parsed_date = datetime.fromisoformat(pub_date_meta.replace('Z', '+00:00'))
+                    parsed_date = _parse_iso(pub_date_meta)
                     return parsed_date.date().isoformat()
                 except ValueError:
                     self.logger.debug(
-                        f"Could not parse meta publication date: {pub_date_meta}")
+                        "Could not parse meta publication date: %s", pub_date_meta)
 
             # Try to extract from structured data or common selectors
-            time_element: Optional[str] = response.css(
-                'time[datetime]::attr(datetime)').get()
-            
+            time_element: str = _TIME_DT(response.selector.root)
+
             if time_element:
                 try:
-                    parsed_date = datetime.fromisoformat(time_element.replace('Z', '+00:00'))
+                    parsed_date = _parse_iso(time_element)
                     return parsed_date.date().isoformat()
                 except ValueError:
                     self.logger.debug(
-                        f"Could not parse time element: {time_element}")
+                        "Could not parse time element: %s", time_element)
 
             # Fallback: Extract date from URL structure
             # URL format may be: https://thehimalayantimes.com/category/YYYY/MM/DD/article-slug
-            url_parts = response.url.split('/')
-            if len(url_parts) >= 6:
-                try:
-                    # Look for year/month/day pattern in URL
-                    for i in range(len(url_parts) - 2):
-                        year = url_parts[i]
-                        month = url_parts[i + 1]
-                        day = url_parts[i + 2]
-
-                        # Validate that these are actually date components
-                        if (year.isdigit() and len(year) == 4 and
-                            month.isdigit() and len(month) == 2 and
-                                day.isdigit() and len(day) == 2):
-
-                            # Create ISO date string
-                            date_str = f"{year}-{month}-{day}"
-                            # Validate the date by parsing it
-                            datetime.strptime(date_str, "%Y-%m-%d")
-                            return date_str
-
-                except (ValueError, IndexError):
-                    self.logger.debug(
-                        f"Could not extract date from URL: {response.url}")
+            match = _URL_DATE_RE.search(response.url)
+            if match:
+                return f"{match[1]}-{match[2]}-{match[3]}"
 
             self.logger.warning(
-                f"No publication date found for {response.url}")
+                "No publication date found for %s", response.url)
             return None
 
         except Exception as e:
             self.logger.error(
-                f"Error extracting publication date from {response.url}: {str(e)}")
+                "Error extracting publication date from %s: %s", response.url, e)
             return None
-
-    def closed(self, reason: str) -> None:
-        """Called when the spider closes.
-
-        This method is called when the spider finishes crawling.
-        It provides final logging and cleanup operations.
-
-        Args:
-            reason: The reason why the spider was closed.
-        """
-        self.logger.info(f"Spider {self.name} closed. Reason: {reason}")
\ No newline at end of file
@@ -6,7 +6,7 @@ RSS feed for efficient article discovery and then fetches complete article
 content from individual pages using Scrapy.
 
 The spider demonstrates:
-- RSS feed parsing using feedparser
+- Streaming RSS feed parsing using lxml iterparse
 - Hybrid approach: RSS for discovery, Scrapy for content extraction
 - Proper use of type hints, logging, and error handling
 - ArticleItem data contract compliance
@@ -14,15 +14,60 @@ The spider demonstrates:
 """
 
 import re
+import sys
+import time
 from datetime import datetime, timezone
 from typing import Any, Generator, List, Optional
 
-import feedparser
 import scrapy
 from scrapy.http import Request, Response
 
+from zerdisha_scrapers import csscache, rss
 from zerdisha_scrapers.items import ArticleItem
 
+# timezone.utc bound once at import; avoids re-resolving the attribute
+# chain on every timestamp.
+_UTC = timezone.utc
+
+# Interned once so every item shares the same immutable string objects
+# instead of allocating fresh copies per article.
+_SPIDER_NAME = sys.intern("kathmandupost")
+_SOURCE_NAME = sys.intern("The Kathmandu Post")
+
+# Meta keys shared by every article request. Zipping values against this
+# tuple hashes the key strings once at import time instead of rebuilding
+# a dict literal (and re-hashing its keys) per entry.
+_META_KEYS = ('rss_title', 'rss_publication_date')
+
+# One pass over the page text replaces the '.updated-time:contains(...)'
+# CSS query (whose :contains translation is expensive) plus the
+# split("Published at")/startswith(":") cleanup chain; the groups feed
+# the month lookup below directly.
+_PUB_RE = re.compile(r'Published at\s*:?\s*([A-Z][a-z]+)\s+(\d{1,2}),\s+(\d{4})')
+
+# Month-name lookup for the fixed "Month D, YYYY" date format; a dict
+# probe plus two int() calls is several times faster than the
+# locale-aware strptime machinery for this known shape.
+_MONTHS = {month: index for index, month in enumerate(
+    ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+     'August', 'September', 'October', 'November', 'December'), 1)}
+
+# One anchored pass over the URL replaces the split('/') scan; the month
+# and day character classes only match real ranges, so no strptime
+# validation round-trip is needed on a match.
+_URL_DATE_RE = re.compile(r'/(\d{4})/(0[1-9]|1[0-2])/(0[1-9]|[12]\d|3[01])/')
+
+# Title and author selectors translated to XPath once at import through
+# the shared cached translator, so each article lookup calls
+# response.xpath directly with no per-call translation or cache probe.
+_TITLE_XPATH = csscache.css_to_xpath('h1::text')
+_AUTHOR_XPATH = csscache.css_to_xpath('.article-author::text')
+
+# Feed sections whose pages carry no body paragraphs under <main>;
+# fetching them only to bail out in parse_article wastes a download
+# slot per entry, so they are filtered at discovery time.
+_EMPTY_PATH_RE = re.compile(r'/(photos?|videos?|gallery|interactive)/')
+
 
 class KathmandupostSpider(scrapy.Spider):
     """Hybrid RSS/Scrapy spider for The Kathmandu Post news articles.
@@ -44,62 +89,105 @@ class KathmandupostSpider(scrapy.Spider):
         rss_url: The RSS feed URL for article discovery.
     """
 
-    name: str = "kathmandupost"
+    name: str = _SPIDER_NAME
     allowed_domains: List[str] = ["kathmandupost.com"]
     rss_url: str = "https://kathmandupost.com/rss"
 
+    # Cap on RSS entries consumed per poll; the streamed parse aborts
+    # before touching the tail of the feed once this many are yielded.
+    max_entries: int = 50
+
+    # Batch-oriented concurrency: the whole poll targets one domain, so
+    # let AutoThrottle find a polite sustained rate instead of the
+    # serial one-request-per-second project default, and schedule
+    # through the downloader-aware queue so in-flight slots stay full.
+    custom_settings = {
+        'CONCURRENT_REQUESTS': 32,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 8,
+        'SCHEDULER_PRIORITY_QUEUE': 'scrapy.pqueues.DownloaderAwarePriorityQueue',
+        'REACTOR_THREADPOOL_MAXSIZE': 20,
+        'DNS_TIMEOUT': 10,
+        'AUTOTHROTTLE_ENABLED': True,
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 4.0,
+        # Every request in a poll hits kathmandupost.com, so the
+        # hostname-caching resolver (available under the project's
+        # asyncio reactor) amortizes one DNS lookup across the batch
+        # instead of thrashing the blocking thread-pool resolver.
+        'DNS_RESOLVER': 'scrapy.resolver.CachingHostnameResolver',
+        'DNSCACHE_ENABLED': True,
+        'DNSCACHE_SIZE': 10000,
+        # Articles are effectively immutable once published, so the
+        # project-wide HTTP cache may serve them for a full day before
+        # revalidation; error responses are never worth replaying from
+        # the cache on a later poll.
+        'HTTPCACHE_EXPIRATION_SECS': 86400,
+        'HTTPCACHE_IGNORE_HTTP_CODES': [500, 503, 504, 400, 408],
+    }
+
     def start_requests(self) -> Generator[Request, None, None]:
-        """Generate initial requests by parsing the RSS feed.
+        """Request the RSS feed through Scrapy's async downloader.
 
-        This method fetches and parses The Kathmandu Post's RSS feed to
-        discover new articles. For each article found in the feed, it
-        creates a request to the full article page with metadata preserved.
+        Fetching the feed as a regular Scrapy request keeps the reactor
+        free during the network round trip (a blocking fetch here would
+        stall every concurrent download at startup) and routes the feed
+        through the HTTP cache middleware like any other page.
 
         Yields:
-            Request: Scrapy requests for individual article pages with
-                    RSS metadata passed via the meta parameter.
+            Request: A single request for the RSS feed, handled by
+                    :meth:`_parse_rss`.
         """
         self.logger.info(
             f"Starting {self.name} spider with RSS feed: {self.rss_url}")
 
+        yield scrapy.Request(
+            self.rss_url, callback=self._parse_rss, dont_filter=True)
+
+    def _parse_rss(self, response: Response) -> Generator[Request, None, None]:
+        """Parse the fetched RSS feed and dispatch article requests.
+
+        The downloaded feed bytes are parsed with the streaming RSS
+        reader, and one request per linked entry is yielded with the RSS
+        metadata preserved.
+
+        Args:
+            response: The HTTP response for the RSS feed itself.
+
+        Yields:
+            Request: Scrapy requests for individual article pages with
+                    RSS metadata passed via the meta parameter.
+        """
         try:
-            # Parse the RSS feed using feedparser
-            self.logger.debug(f"Fetching RSS feed from: {self.rss_url}")
-            feed = feedparser.parse(self.rss_url)
-
-            if feed.bozo:
-                self.logger.warning(
-                    f"RSS feed parsing had issues: {feed.bozo_exception}")
-
-            # Check if we got any entries
-            if not hasattr(feed, 'entries') or not feed.entries:
-                self.logger.error(
-                    f"No entries found in RSS feed: {self.rss_url}")
-                return
-
-            self.logger.info(f"Found {len(feed.entries)} articles in RSS feed")
-
-            # Create requests for each article in the feed
-            for entry in feed.entries:
-                if not hasattr(entry, 'link') or not entry.link:
-                    self.logger.warning("RSS entry missing link, skipping")
+            # One timestamp per batch, kept on the spider instead of
+            # being copied into (and scheduled with) every request meta
+            self._start_time: datetime = datetime.now(_UTC)
+
+            # Entries dispatched on previous polls are skipped before a
+            # Request is even constructed, so steady-state cost scales
+            # with new items rather than feed size
+            self._seen_guids = seen = rss.load_seen_guids(self.name)
+
+            for entry in rss.parse_rss2(
+                    response.body, max_entries=self.max_entries):
+                link = entry.get('link')
+                if not link or link in seen:
                     continue
+                seen.add(link)
 
-                # Extract metadata from RSS entry
-                article_url: str = str(entry.link)
-                title: str = getattr(entry, 'title', '')
-
-                self.logger.debug(
-                    f"Creating request for article: {title[:50]}...")
+                # Media-only sections never yield article text; skip
+                # them before a Request is even constructed
+                if _EMPTY_PATH_RE.search(link):
+                    self.logger.debug(
+                        f"Skipping media-only entry: {link}")
+                    continue
 
-                # Yield request to the full article page
+                # The meta dict is zipped against the shared key tuple
                 yield scrapy.Request(
-                    url=article_url,
+                    url=link,
                     callback=self.parse_article,
-                    meta={
-                        'rss_title': title,
-                        'spider_start_time': datetime.now(timezone.utc)
-                    }
+                    meta=dict(zip(_META_KEYS, (
+                        entry.get('title') or '',
+                        entry.get('published'),
+                    )))
                 )
 
         except Exception as e:
@@ -122,69 +210,72 @@ class KathmandupostSpider(scrapy.Spider):
         """
         self.logger.debug(f"Parsing article page: {response.url}")
 
-        try:
-            # Extract full article content using CSS selector
-            paragraphs: List[str] = response.css('main p::text').getall()
-
-            if not paragraphs:
-                self.logger.warning(
-                    f"No content found using CSS selector 'main p' for {response.url}")
-                return
-
-            # Join all paragraphs into full text
-            full_text: str = '\n\n'.join(
-                paragraph.strip() for paragraph in paragraphs if paragraph.strip())
-
-            if not full_text:
-                self.logger.warning(
-                    f"No meaningful content extracted from {response.url}")
-                return
-
-            # Get metadata from RSS feed (passed via meta)
-            rss_title: str = response.meta.get('rss_title', '')
-
-            # Use RSS title if available, otherwise try to extract from page
-            title: str = rss_title
-            if not title:
-                page_title: Optional[str] = response.css('h1::text').get()
-                title = page_title.strip() if page_title else ''
-
-            if not title:
-                self.logger.warning(f"No title found for {response.url}")
-                return
-
-            # Extract author if available (optional field)
-            author: Optional[str] = response.css('.article-author::text').get()
-            if author:
-                author = author.strip()
-
-            # Extract publication date from the article page
-            publication_date: Optional[str] = self._extract_publication_date(
-                response)
-
-            # Create timezone-aware timestamps in ISO 8601 format
-            scraped_at: str = datetime.now(timezone.utc).isoformat()
-
-            # Create and populate the ArticleItem
-            article: ArticleItem = ArticleItem()
-
-            article['url'] = str(response.url)
-            article['source_name'] = "The Kathmandu Post"
-            article['title'] = title.strip()
-            article['full_text'] = full_text
-            article['author'] = author
-            article['publication_date'] = publication_date
-            article['scraped_at'] = scraped_at
-            article['spider_name'] = self.name
-
-            self.logger.info(
-                f"Successfully extracted article: {title[:50]}...")
+        # Extract full article content with one lxml traversal:
+        # text_content() builds each paragraph's text in C instead of
+        # materializing every text-node fragment that 'main p::text'
+        # would return through parsel. Stripping and dropping blank
+        # paragraphs inside the same pass means the joined text needs
+        # no whitespace-collapsing regex afterwards.
+        main = response.selector.root.find('.//main')
+        paragraphs: List[str] = [
+            text for text in
+            (p.text_content().strip() for p in main.iter('p'))
+            if text
+        ] if main is not None else []
+
+        if not paragraphs:
+            self.logger.warning(
+                f"No content found using CSS selector 'main p' for {response.url}")
+            return
+
+        # Every surviving paragraph is stripped and non-empty, so a
+        # plain join already yields clean double-newline boundaries
+        full_text: str = '\n\n'.join(paragraphs)
+
+        # Get metadata from RSS feed (passed via meta)
+        rss_title: str = response.meta.get('rss_title', '')
+
+        # Use RSS title if available, otherwise try to extract from page
+        title: str = rss_title
+        if not title:
+            page_title: Optional[str] = response.xpath(_TITLE_XPATH).get()
+            title = page_title.strip() if page_title else ''
+
+        if not title:
+            self.logger.warning(f"No title found for {response.url}")
+            return
+
+        # Extract author if available (optional field)
+        author: Optional[str] = response.xpath(_AUTHOR_XPATH).get()
+        if author:
+            author = author.strip()
+
+        # Extract publication date from the article page
+        publication_date: Optional[str] = self._extract_publication_date(
+            response)
+
+        # One C-level strftime call produces the ISO 8601 Z form
+        # directly, skipping the tz-aware datetime allocation per item
+        scraped_at: str = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+
+        # Populate the ArticleItem in one constructor call: every
+        # field lands via a keyword argument instead of eight separate
+        # validated __setitem__ calls.
+        article: ArticleItem = ArticleItem(
+            url=str(response.url),
+            source_name=_SOURCE_NAME,
+            title=title.strip(),
+            full_text=full_text,
+            author=author,
+            publication_date=publication_date,
+            scraped_at=scraped_at,
+            spider_name=self.name,
+        )
 
-            yield article
+        self.logger.info(
+            f"Successfully extracted article: {title[:50]}...")
 
-        except Exception as e:
-            self.logger.error(
-                f"Error parsing article {response.url}: {str(e)}")
+        yield article
 
     def _extract_publication_date(self, response: Response) -> Optional[str]:
         """Extract publication date from the article page.
@@ -198,61 +289,34 @@ class KathmandupostSpider(scrapy.Spider):
         Returns:
             The publication date in ISO 8601 format, or None if not found.
         """
-        try:
-            # Try to extract from "Published at" text on the page
-            published_text: Optional[str] = response.css(
-                '.updated-time:contains("Published at") ::text').get()
-
-            if published_text:
-                # Clean up the text and extract the date part
-                # Example: "Published at : July 3, 2025"
-                published_text = published_text.strip()
-                if "Published at" in published_text:
-                    date_part = published_text.split("Published at")[1].strip()
-                    if date_part.startswith(":"):
-                        date_part = date_part[1:].strip()
-
-                    # Try to parse the date and convert to ISO format
-                    try:
-                        # Handle format like "July 3, 2025"
-                        parsed_date = datetime.strptime(date_part, "%B %d, %Y")
-                        return parsed_date.isoformat()
-                    except ValueError:
-                        self.logger.debug(
-                            f"Could not parse published date: {date_part}")
-
-            # Fallback: Extract date from URL structure
-            # URL format: https://kathmandupost.com/category/YYYY/MM/DD/article-slug
-            url_parts = response.url.split('/')
-            if len(url_parts) >= 6:
+        # URL format: https://kathmandupost.com/category/YYYY/MM/DD/slug
+        # The date is reliably embedded in the URL, so this one short
+        # regex pass is the common-case exit; the full-document text
+        # scan below only runs when the URL carries no date.
+        match = _URL_DATE_RE.search(response.url)
+        if match:
+            return f"{match[1]}-{match[2]}-{match[3]}"
+
+        # Fallback: extract the "Published at : July 3, 2025" date in
+        # one precompiled regex pass over the page text
+        match = _PUB_RE.search(response.text)
+        if match:
+            # Handle format like "July 3, 2025" via the month lookup;
+            # only the datetime constructor can raise here (day out of
+            # range for the month), so the except stays that narrow
+            month: Optional[int] = _MONTHS.get(match[1])
+            if month is not None:
                 try:
-                    year = url_parts[4]
-                    month = url_parts[5]
-                    day = url_parts[6]
-
-                    # Validate that these are actually date components
-                    if (year.isdigit() and len(year) == 4 and
-                        month.isdigit() and len(month) == 2 and
-                            day.isdigit() and len(day) == 2):
-
-                        # Create ISO date string
-                        date_str = f"{year}-{month}-{day}"
-                        # Validate the date by parsing it
-                        datetime.strptime(date_str, "%Y-%m-%d")
-                        return date_str
-
-                except (ValueError, IndexError):
-                    self.logger.debug(
-                        f"Could not extract date from URL: {response.url}")
+                    return datetime(
+                        int(match[3]), month, int(match[2])).isoformat()
+                except ValueError:
+                    pass
+            self.logger.debug(
+                f"Could not parse published date: {match[0]}")
 
-            self.logger.warning(
-                f"No publication date found for {response.url}")
-            return None
-
-        except Exception as e:
-            self.logger.error(
-                f"Error extracting publication date from {response.url}: {str(e)}")
-            return None
+        self.logger.warning(
+            f"No publication date found for {response.url}")
+        return None
 
     def closed(self, reason: str) -> None:
         """Called when the spider closes.
@@ -263,4 +327,9 @@ class KathmandupostSpider(scrapy.Spider):
         Args:
             reason: The reason why the spider was closed.
         """
+        # Persist the dispatched-entry GUIDs so the next poll skips them
+        seen = getattr(self, '_seen_guids', None)
+        if seen:
+            rss.save_seen_guids(self.name, seen)
+
         self.logger.info(f"Spider {self.name} closed. Reason: {reason}")